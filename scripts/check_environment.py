@@ -1,26 +1,18 @@
-
 def main():
     import sys
 
-    try:
-        from packaging import version
-    except Exception:
-        raise ModuleNotFoundError(
-                'Module packaging not found. Try running make setup first.'
-                )
-
-    PYTHON_VERSION = "3.12"
-    PYTHON_VERSION = version.parse(PYTHON_VERSION)
+    PYTHON_VERSION = (3, 12)
 
     minimum = PYTHON_VERSION
+    minimum_str = '.'.join(map(str, minimum))
 
-    print(f'Parsed minimum Python version is {PYTHON_VERSION}')
+    print(f'Parsed minimum Python version is {minimum_str}')
 
     current = sys.version_info
-    current_version = version.parse(f'{current.major}.{current.minor}.{current.micro}')
+    current_version = tuple(current[:3])
 
     current_major = current.major
-    required_major = minimum.major
+    required_major = minimum[0]
 
     if current_major != required_major:
         raise TypeError(
@@ -31,12 +23,12 @@ def main():
         print('>>> Python is in the right ballpark.')
 
     print(f'current Python version is {current}')
-    print(f'required Python version is ^{minimum}')
+    print(f'required Python version is ^{minimum_str}')
 
     # If the current version is lower than required, raise error
     if current_version < minimum:
         raise TypeError(
-            f'This project requires Python {minimum}. Found: Python {current}.'
+            f'This project requires Python {minimum_str}. Found: Python {current}.'
         )
     else:
         print('>>> Environment passed all tests!')
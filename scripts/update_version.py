@@ -1,14 +1,17 @@
+import re
 import sys
+import tomllib
 from pathlib import Path
 
-try:
-    import tomllib  # py3.11+
-except ModuleNotFoundError:  # py3.10 fallback
-    import tomli as tomllib  # type: ignore[no-redef]
+# Every `__version__` assignment line, annotated (`__version__: str = ...`)
+# or indented ones included; each is rewritten to the canonical form, keeping
+# its indentation.
+VERSION_LINE_RE = re.compile(rb"^([ \t]*)__version__\b[^\r\n]*", re.M)
 
 
 def read_version(pyproject_path: Path) -> str:
-    data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    with pyproject_path.open("rb") as f:
+        data = tomllib.load(f)
     # New Poetry (PEP 621)
     proj = data.get("project") or {}
     if "version" in proj:
@@ -35,24 +38,18 @@ def update_version_in_init():
 
     version = read_version(pyproject_path)
 
-    init_text = init_file_path.read_text(encoding="utf-8")
-    lines = init_text.splitlines()
-    out_lines = []
-    replaced = False
-    for line in lines:
-        if line.strip().startswith("__version__"):
-            out_lines.append(f"__version__ = '{version}'")
-            replaced = True
-        else:
-            out_lines.append(line)
-    if not replaced:
-        # Ensure a trailing newline, then append
-        if out_lines and out_lines[-1] != "":
-            out_lines.append("")
-        out_lines.append(f"__version__ = '{version}'")
-
-    new_text = "\n".join(out_lines).rstrip() + "\n"
-    init_file_path.write_text(new_text, encoding="utf-8")
+    raw = init_file_path.read_bytes()
+    line = f"__version__ = '{version}'".encode("utf-8")
+    new, n = VERSION_LINE_RE.subn(lambda m: m.group(1) + line, raw)
+    if n and new == raw:
+        print(f"No change: __version__ in {init_file_path} is {version}")
+        return
+
+    if not n:
+        # Separate from existing content by a blank line, then append
+        body = raw.rstrip()
+        new = (body + b"\n\n" if body else b"") + line + b"\n"
+    init_file_path.write_bytes(new)
     print(f"Updated __version__ in {init_file_path} to {version}")
 
 
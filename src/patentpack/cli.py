@@ -4,7 +4,9 @@ from typing import Optional
 
 import typer
 
-from .client import PatentPack
+# Only the lightweight enum is needed to declare options; PatentPack (and
+# with it the provider HTTP stack) is imported inside each command so that
+# `--help` and argument errors never pay for it.
 from .core.contracts import Provider
 
 app = typer.Typer(help="patentpack: unified CLI for USPTO/EPO providers")
@@ -24,6 +26,8 @@ def count_cpc_year(
     debug: bool = typer.Option(False, help="Verbose provider diagnostics"),
 ):
     """Return total count for CPC prefix in a given year."""
+    from .client import PatentPack
+
     kwargs = {"rpm": rpm}
     if debug:
         kwargs["debug"] = True
@@ -54,6 +58,8 @@ def count_cpc_company_year(
     epo_key: Optional[str] = typer.Option(None, help="EPO OPS key"),
     epo_secret: Optional[str] = typer.Option(None, help="EPO OPS secret"),
 ):
+    from .client import PatentPack
+
     kwargs = {"rpm": rpm}
     if provider == Provider.EPO:
         if epo_key is not None:
@@ -86,6 +92,8 @@ def assignee_discover(
     rpm: int = typer.Option(30, help="Requests per minute pacing"),
 ):
     """List assignees whose organization begins with the given prefix."""
+    from .client import PatentPack
+
     pp = PatentPack(provider, rpm=rpm)
     res = pp.assignee_discover(prefix=prefix, limit=limit)
     for a in res.items:
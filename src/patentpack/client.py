@@ -12,6 +12,8 @@ class PatentPack:
     Delegates to a provider instance selected by `Provider`.
     """
 
+    __slots__ = ("_provider",)
+
     def __init__(self, provider: Provider, **provider_kwargs) -> None:
         self._provider = make_provider(provider, **provider_kwargs)
 
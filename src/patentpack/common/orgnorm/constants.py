@@ -12,6 +12,21 @@ ADR_SUFFIX_RE = re.compile(
 )
 ASCII_PAT = re.compile(r"[A-Za-z]")
 
+# norm() cleanup: drop chars outside [word & - / . space], plus any period
+# that ends a token once those chars are gone ('c.' -> 'c', 'co.!' -> 'co')
+NORM_CLEAN_RE = re.compile(r"[^\w&\-/\. ]+|\.(?=[^\w&\-/\. ]*(?: |$))")
+
+# Retrieval-variant patterns
+CO_LTD_RE = re.compile(r"\bco\b\.?\s*,?\s*ltd\b\.?", re.I)
+SPA_RE = re.compile(r"(s\.?\s*p\.?\s*a\.?|spa)(\.)?\b", re.I)
+SPELLED_SPA_RE = re.compile(r"societ[aà]\s+per\s+azioni", re.I)
+LETTER_SPA_RE = re.compile(
+    r"(&\s*)([A-Za-z])(\.?\s+)(s\.?\s*p\.?\s*a\.?|spa)(\.)?\b", re.I
+)
+MULTI_DOT_RE = re.compile(r"\.{2,}")
+TRAILING_MULTI_DOT_RE = re.compile(r"\.{2,}\s*$")
+NON_ALPHA_RE = re.compile(r"[^a-z]")
+
 # Corporate/legal suffixes used for stemming
 SUFFIX_RE = re.compile(
     r"\b("
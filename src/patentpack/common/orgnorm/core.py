@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import html
-import re
 import unicodedata
+from functools import lru_cache
 
 from .constants import (
     ADR_SUFFIX_RE,
     ASCII_PAT,
+    NORM_CLEAN_RE,
     SPACE_RE,
     TRAILING_SLASH_TAG_RE,
 )
@@ -21,11 +22,6 @@ def _strip_accents(s: str) -> str:
     )
 
 
-def _ampersand_to_and(s: str) -> str:
-    # Canonicalize '&' ↔ 'and' for comparisons
-    return re.sub(r"&", " and ", s)
-
-
 # ---------- core normalizers ----------
 def norm(s: str) -> str:
     """
@@ -36,46 +32,63 @@ def norm(s: str) -> str:
     """
     if not isinstance(s, str):
         return ""
+    return _norm(s)
+
+
+@lru_cache(maxsize=4096)
+def _norm(s: str) -> str:
     x = s.strip()
     for _ in range(4):  # fix '&amp;amp;'
+        if "&" not in x:  # no entity left to decode (the common case)
+            break
         new = html.unescape(x)
         if new == x:
             break
         x = new
-    x = _strip_accents(x)
-    x = unicodedata.normalize("NFKC", x)
-    x = _ampersand_to_and(x)
-    x = x.lower()
+    if not x.isascii():  # NFKD/NFKC are identities on ASCII
+        x = _strip_accents(x)
+        x = unicodedata.normalize("NFKC", x)
+    # Canonicalize '&' ↔ 'and' for comparisons
+    x = x.lower().replace("&", " and ")
+    return _norm_tail(x)
 
+
+def _norm_tail(x: str) -> str:
+    """
+    Final, ASCII-level part of norm(): '/TAG' drop, noise/period cleanup and
+    whitespace collapse. Re-applied after trimming an already-normalized
+    string, since the trim can expose a new tag or token-final period.
+    """
     # Drop very specific trailing slash tags like '/the', '/ny', '/de' (not 'A/B')
     x = TRAILING_SLASH_TAG_RE.sub("", x)
 
-    # keep word chars, &, -, /, ., space
-    x = re.sub(r"[^\w&\-/\. ]+", "", x)
+    # One pass: drop noise chars and token-final periods ('c.' -> 'c', 'co.' -> 'co')
+    x = NORM_CLEAN_RE.sub("", x)
 
-    # collapse single-letter abbreviations like 'C.' -> 'C'
-    x = re.sub(r"\b([a-z])\.(?=\s|$)", r"\1", x)
+    return SPACE_RE.sub(" ", x).strip()
 
-    # remove remaining trailing periods on tokens (e.g., 'co.' -> 'co', 'ltd.' -> 'ltd')
-    x = re.sub(r"\.(?=\s|$)", "", x)
 
-    return SPACE_RE.sub(" ", x).strip()
+def _strip_adr_suffix_on_normed(x: str) -> str:
+    """ADR tail removal for a string that already went through norm()."""
+    return ADR_SUFFIX_RE.sub("", x).strip()
+
+
+@lru_cache(maxsize=4096)
+def _strip_adr_suffix(s: str) -> str:
+    return _strip_adr_suffix_on_normed(norm(s))
 
 
 def strip_adr_suffix(s: str) -> str:
     """
     Remove trailing ADR/ADS/GDR decorations (incl. 'ADRhedged', '(ADR)', etc.) for comparison purposes.
     """
-    x = s or ""
-    x = norm(x)
-    x = ADR_SUFFIX_RE.sub("", x).strip()
-    return x
+    return _strip_adr_suffix(s if isinstance(s, str) else "")
 
 
 # ---------- comparison-normalized helpers ----------
-def cmp_norm(s: str) -> str:
-    """Normalized string for equality comparisons (ADR suffix removed)."""
-    return strip_adr_suffix(s)
+# Normalized string for equality comparisons (ADR suffix removed). A plain
+# alias rather than a wrapper: it sits in the match-scoring inner loop.
+cmp_norm = strip_adr_suffix
 
 
 def name_has_ascii(name: str) -> bool:
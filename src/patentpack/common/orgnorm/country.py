@@ -1,4 +1,4 @@
-import re
+from functools import lru_cache
 
 from .constants import (
     SUFFIX_COUNTRY_HINTS,
@@ -10,14 +10,15 @@ def country_hints_from_name(name: str) -> list[str]:
     """
     Return 2‑letter country hints when a short legal suffix is present (e.g., 'AG' → DE/AT/CH).
     """
+    return list(_country_hints(name if isinstance(name, str) else ""))
+
+
+@lru_cache(maxsize=4096)
+def _country_hints(name: str) -> tuple[str, ...]:
     n = norm(name)
     toks = n.split()
     if not toks:
-        return []
+        return ()
+    # norm() already lowercased; with dots gone every S.p.A. spelling is 'spa'
     last = toks[-1].replace(".", "")
-    key = (
-        "s.p.a."
-        if re.fullmatch(r"s\.?\s*p\.?\s*a\.?|spa", last, flags=re.I)
-        else last
-    )
-    return SUFFIX_COUNTRY_HINTS.get(key.lower(), [])
+    return tuple(SUFFIX_COUNTRY_HINTS.get(last, ()))
@@ -1,28 +1,44 @@
 from __future__ import annotations
 
-from .constants import ADR_PAT, SPACE_RE, STOPWORDS, SUFFIX_RE
-from .core import norm, strip_adr_suffix
+from functools import lru_cache
 
+from .constants import ADR_PAT, STOPWORDS, SUFFIX_RE
+from .core import _norm_tail, _strip_adr_suffix_on_normed, norm
 
-def _strip_stopwords_from_tokens(tokens: list[str]) -> list[str]:
-    return [t for t in tokens if t and t not in STOPWORDS]
+
+def _stem_normed(x: str) -> str:
+    """Suffix/stopword stripping for a string that already went through norm()."""
+    x = SUFFIX_RE.sub("", x)
+    parts = x.split()
+    # Only rebuild the token list when a stopword is actually present
+    if STOPWORDS and any(t in STOPWORDS for t in parts):
+        parts = [t for t in parts if t not in STOPWORDS]
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _stem(s: str) -> str:
+    return _stem_normed(norm(s))
 
 
 def stem(s: str) -> str:
     """
     Normalized string with common corporate suffixes removed; keeps '&/and' canonicalization.
     """
-    x = norm(s)
-    x = SUFFIX_RE.sub("", x)
-    x = SPACE_RE.sub(" ", x).strip()
-    toks = _strip_stopwords_from_tokens(x.split())
-    return " ".join(toks)
+    return _stem(s if isinstance(s, str) else "")
+
+
+@lru_cache(maxsize=4096)
+def _cmp_stem(s: str) -> str:
+    # Strip ADR bits before stemming; normalize once and only redo the cheap
+    # tail of norm() that the ADR trim can re-expose ('foo/de adr' -> 'foo')
+    x = _norm_tail(_strip_adr_suffix_on_normed(norm(s)))
+    return _stem_normed(x)
 
 
 def cmp_stem(s: str) -> str:
     """Stemmed (suffix-stripped) string for comparisons (ADR suffix removed, corporate forms trimmed)."""
-    # Strip ADR bits before stemming (stem() calls norm() again internally)
-    return stem(strip_adr_suffix(s))
+    return _cmp_stem(s if isinstance(s, str) else "")
 
 
 def is_adr_like_name(name: str) -> bool:
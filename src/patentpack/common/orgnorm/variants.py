@@ -1,35 +1,114 @@
 from __future__ import annotations
 
 import re
-from typing import Callable, Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Iterable, Iterator
 
 from .constants import (
+    ADR_SUFFIX_RE,
+    CO_LTD_RE,
     DOTTING_MAP,
+    LETTER_SPA_RE,
+    MULTI_DOT_RE,
+    NON_ALPHA_RE,
+    SPA_RE,
     SPACE_RE,
+    SPELLED_SPA_RE,
     SUFFIX_TO_FULL,
+    TRAILING_MULTI_DOT_RE,
     TRAILING_SLASH_TAG_RE,
 )
 
 Transform = Callable[[str], Iterable[str]]
 
+# SUFFIX_TO_FULL keyed by every spelling a right-stripped last token can take
+_FULL_FORM_BY_LAST_TOKEN = {
+    **SUFFIX_TO_FULL,
+    **dict.fromkeys(("s.pa", "sp.a", "s.p.a"), SUFFIX_TO_FULL["s.p.a."]),
+}
+
+# Whole-word matcher per DOTTING_MAP entry, accepting either spelling
+_DOTTING_PATTERNS = [
+    (
+        undotted,
+        dotted,
+        re.compile(
+            r"\b"
+            + re.escape(undotted)
+            + r"\b|\b"
+            + re.escape(dotted).replace(r"\.", r"\.?")
+            + r"\b",
+            re.I,
+        ),
+    )
+    for undotted, dotted in DOTTING_MAP.items()
+]
+# Cheap pre-check: does any of the above match at all?
+_DOTTING_ANY_RE = re.compile(
+    "|".join(f"(?:{p.pattern})" for _, _, p in _DOTTING_PATTERNS), re.I
+)
+
+# Last-token keys (letters only) for the Swedish AB prefix variants
+_SWEDISH_AB_TOKENS = frozenset({"ab", "a", "aktiebolag", "aktiebolaget"})
+
+# Last-token keys (letters only) safe to drop for full-text retrieval
+_SINGLE_TOKEN_SUFFIXES = frozenset(
+    {
+        "ab",
+        "aktiebolag",
+        "aktiebolaget",
+        "ag",
+        "nv",
+        "bv",
+        "sa",
+        "spa",
+        "oy",
+        "oyj",
+        "gmbh",
+        "kk",
+        "as",
+        "asa",
+        "se",
+        "llc",
+        "plc",
+        "inc",
+        "ltd",
+        "kgaa",
+        "kg",
+        "sas",
+        "srl",
+        "aps",
+        "pte",
+        "pty",
+    }
+)
+
 # ---- retrieval helpers ------------------------------------------------
 
 
-def _run_pipeline(seeds: Iterable[str], steps: list[Transform]) -> list[str]:
+def _unique(values: Iterable[str]) -> Iterator[str]:
+    """Yield values in order, skipping repeats."""
+    seen: set[str] = set()
+    for v in values:
+        if v not in seen:
+            seen.add(v)
+            yield v
+
+
+def _run_pipeline(
+    seeds: Iterable[str], steps: list[Transform]
+) -> Iterator[str]:
     """
-    Apply each transform sequentially over the growing set of strings.
-    Equivalent to the old nested loops, but clearer and faster to read.
-    We keep order stable and dedupe only at the very end of expand_query_variants.
+    Lazily chain each transform over the stream produced by the previous one.
+    Each step returns 1..N variants for a single input; repeats are dropped
+    between steps here rather than inside every transform, so the helpers
+    can return duplicates freely. Order is stable.
     """
-    current: list[str] = list(seeds)
+    stream: Iterable[str] = seeds
     for step in steps:
-        next_batch: list[str] = []
-        for s in current:
-            # Each step returns 1..N variants for a single input s
-            for v in step(s):
-                next_batch.append(v)
-        current = next_batch
-    return current
+        stream = _unique(chain.from_iterable(map(step, stream)))
+    return iter(stream)
 
 
 def _clean_base_for_variants(name: str) -> str:
@@ -40,12 +119,7 @@ def _clean_base_for_variants(name: str) -> str:
     """
     s = (name or "").strip()
     s = TRAILING_SLASH_TAG_RE.sub("", s)
-    s = re.sub(
-        r"(?:\s*[-,]?\s*(?:adr(?:hedged)?|ads|gdr)(?:\s*\([^)]*\))?\s*)+$",
-        "",
-        s,
-        flags=re.I,
-    ).strip()
+    s = ADR_SUFFIX_RE.sub("", s).strip()
     return s
 
 
@@ -57,59 +131,41 @@ def _maybe_the_variants(original: str) -> list[str]:
     s = (original or "").strip()
     if not s:
         return out
-    if re.match(r"^\s*the\s+\S", s, flags=re.I):
+    # s is stripped, so 'the' + whitespace implies a non-space follows
+    if len(s) > 3 and s[:3].lower() == "the" and s[3].isspace():
         out.append(s)
-        out.append(re.sub(r"^\s*the\s+", "", s, flags=re.I).strip())
+        out.append(s[3:].lstrip())
     else:
         out.append(s)
         out.append(f"The {s}")
-    seen, uniq = set(), []
-    for v in out:
-        if v not in seen:
-            seen.add(v)
-            uniq.append(v)
-    return uniq
+    return out
 
 
 def _emit_both_dotted_and_undotted(
-    seed: str, token: str, dotted: str
+    seed: str, token: str, dotted: str, pat_any: re.Pattern[str]
 ) -> list[str]:
     """
     Ensure dotted/undotted forms of a short legal token exist in the string.
     Works on whole-word tokens, case-insensitive.
     """
     out = [seed]
-    pat_any = re.compile(
-        r"\b"
-        + re.escape(token)
-        + r"\b|\b"
-        + re.escape(dotted).replace(r"\.", r"\.?")
-        + r"\b",
-        re.I,
-    )
     if pat_any.search(seed):
         undotted = pat_any.sub(token, seed)
         with_dots = pat_any.sub(dotted, seed)
         out.extend([undotted, with_dots])
-    uniq, seen = [], set()
-    for v in out:
-        vv = re.sub(r"\.{2,}", ".", v)
-        if vv not in seen:
-            seen.add(vv)
-            uniq.append(vv)
-    return uniq
+    return [MULTI_DOT_RE.sub(".", v) for v in out]
 
 
 def _ensure_dotted_abbrev_variants(s: str) -> list[str]:
+    if not _DOTTING_ANY_RE.search(s):
+        # No short-form token anywhere: only the '..' cleanup can apply
+        return [s, MULTI_DOT_RE.sub(".", s)]
     out = [s]
-    for undotted, dotted in DOTTING_MAP.items():
-        out.extend(_emit_both_dotted_and_undotted(s, undotted, dotted))
-    uniq, seen = [], set()
-    for v in out:
-        if v not in seen:
-            seen.add(v)
-            uniq.append(v)
-    return uniq
+    for undotted, dotted, pat_any in _DOTTING_PATTERNS:
+        out.extend(
+            _emit_both_dotted_and_undotted(s, undotted, dotted, pat_any)
+        )
+    return out
 
 
 def _canonical_italian_spa(s: str) -> list[str]:
@@ -120,33 +176,22 @@ def _canonical_italian_spa(s: str) -> list[str]:
       - if pattern '& <LETTER> SpA' appears, add '& <LETTER>. S.p.A.' variant
     """
     out = [s]
-    spa_pat = re.compile(r"(s\.?\s*p\.?\s*a\.?|spa)(\.)?\b", re.I)
-    spelled_pat = re.compile(r"societ[aà]\s+per\s+azioni", re.I)
-
-    if spa_pat.search(s) or spelled_pat.search(s):
-        dotted = spa_pat.sub("S.p.A.", s)
-        spelled = spa_pat.sub("Società per Azioni", s)
+    if SPA_RE.search(s) or SPELLED_SPA_RE.search(s):
+        dotted = SPA_RE.sub("S.p.A.", s)
+        spelled = SPA_RE.sub("Società per Azioni", s)
         out.extend([dotted, spelled])
 
-    if spelled_pat.search(s):
-        out.append(spelled_pat.sub("S.p.A.", s))
+    if SPELLED_SPA_RE.search(s):
+        out.append(SPELLED_SPA_RE.sub("S.p.A.", s))
 
-    pat_letter_spa = re.compile(
-        r"(&\s*)([A-Za-z])(\.?\s+)(s\.?\s*p\.?\s*a\.?|spa)(\.)?\b", re.I
-    )
-    if pat_letter_spa.search(s):
+    if LETTER_SPA_RE.search(s):
         out.append(
-            pat_letter_spa.sub(
+            LETTER_SPA_RE.sub(
                 lambda m: f"{m.group(1)}{m.group(2).upper()}. S.p.A.", s
             )
         )
 
-    seen, uniq = set(), []
-    for v in out:
-        if v not in seen:
-            seen.add(v)
-            uniq.append(v)
-    return uniq
+    return out
 
 
 def _suffix_full_form_variant(s: str) -> list[str]:
@@ -157,16 +202,10 @@ def _suffix_full_form_variant(s: str) -> list[str]:
     toks = s.strip().split()
     if not toks:
         return out
-    last = toks[-1].rstrip(".")
-    map_key = (
-        "s.p.a."
-        if re.fullmatch(r"s\.?\s*p\.?\s*a\.?|spa", last, flags=re.I)
-        else last.lower()
-    )
-    full = SUFFIX_TO_FULL.get(map_key)
+    full = _FULL_FORM_BY_LAST_TOKEN.get(toks[-1].rstrip(".").lower())
     if full:
         out.append(" ".join(toks[:-1] + [full]))
-    return list(dict.fromkeys(out))
+    return out
 
 
 def _swedish_ab_prefix_variants(s: str) -> list[str]:
@@ -180,12 +219,12 @@ def _swedish_ab_prefix_variants(s: str) -> list[str]:
     if not toks:
         return out
     last_raw = toks[-1]
-    last_key = re.sub(r"[^a-z]", "", last_raw.lower())
-    if last_key in {"ab", "a", "aktiebolag", "aktiebolaget"}:
+    last_key = NON_ALPHA_RE.sub("", last_raw.lower())
+    if last_key in _SWEDISH_AB_TOKENS:
         base = " ".join(toks[:-1]).strip()
         if base:
             out.extend([f"AB {base}", f"Aktiebolaget {base}"])
-    return list(dict.fromkeys(out))
+    return out
 
 
 def _drop_trailing_single_token_suffix(s: str) -> list[str]:
@@ -197,40 +236,12 @@ def _drop_trailing_single_token_suffix(s: str) -> list[str]:
     if not toks:
         return out
     last_raw = toks[-1]
-    last_key = re.sub(r"[^a-z]", "", last_raw.lower())
-    SINGLE = {
-        "ab",
-        "aktiebolag",
-        "aktiebolaget",
-        "ag",
-        "nv",
-        "bv",
-        "sa",
-        "spa",
-        "oy",
-        "oyj",
-        "gmbh",
-        "kk",
-        "as",
-        "asa",
-        "se",
-        "llc",
-        "plc",
-        "inc",
-        "ltd",
-        "kgaa",
-        "kg",
-        "sas",
-        "srl",
-        "aps",
-        "pte",
-        "pty",
-    }
-    if last_key in SINGLE and len(toks) >= 2:
+    last_key = NON_ALPHA_RE.sub("", last_raw.lower())
+    if last_key in _SINGLE_TOKEN_SUFFIXES and len(toks) >= 2:
         base = " ".join(toks[:-1]).strip()
         if base:
             out.append(base)
-    return list(dict.fromkeys(out))
+    return out
 
 
 def _sanitize_query_value(s: str) -> str:
@@ -243,10 +254,53 @@ def _sanitize_query_value(s: str) -> str:
     if not x:
         return ""
     x = SPACE_RE.sub(" ", x)
-    x = re.sub(r"\.{2,}\s*$", ".", x)
+    x = TRAILING_MULTI_DOT_RE.sub(".", x)
     return x.strip()
 
 
+def _co_ltd_to_company_limited(s: str) -> list[str]:
+    v = CO_LTD_RE.sub("Company Limited", s)
+    # return both original and expanded if they differ, preserving order
+    return [s] if v == s else [s, v]
+
+
+_VARIANT_STEPS: list[Transform] = [
+    _co_ltd_to_company_limited,
+    _canonical_italian_spa,  # SPA dotted + spelled forms
+    _suffix_full_form_variant,  # AG/AB/NV/SA → full form
+    _ensure_dotted_abbrev_variants,  # BV<->B.V., NV<->N.V., SA<->S.A., etc.
+    _swedish_ab_prefix_variants,  # 'SKF AB' -> 'AB SKF' / 'Aktiebolaget SKF'
+    _drop_trailing_single_token_suffix,
+]
+
+# Union of the in-string triggers of the steps above
+_VARIANT_TRIGGER_RE = re.compile(
+    "|".join(
+        f"(?:{p.pattern})"
+        for p in (CO_LTD_RE, SPA_RE, SPELLED_SPA_RE, _DOTTING_ANY_RE)
+    ),
+    re.I,
+)
+
+
+def _is_inert(s: str) -> bool:
+    """
+    True when no step in _VARIANT_STEPS can emit anything other than `s`:
+    no trigger pattern, no '..' to collapse, and a last token that none of
+    the suffix tables know.
+    """
+    if ".." in s or _VARIANT_TRIGGER_RE.search(s):
+        return False
+    toks = s.split()
+    if not toks:
+        return True
+    last = toks[-1]
+    if last.rstrip(".").lower() in _FULL_FORM_BY_LAST_TOKEN:
+        return False
+    key = NON_ALPHA_RE.sub("", last.lower())
+    return key not in _SWEDISH_AB_TOKENS and key not in _SINGLE_TOKEN_SUFFIXES
+
+
 # ---- public API -------------------------------------------------------
 
 
@@ -264,28 +318,15 @@ def expand_query_variants(name: str) -> list[str]:
       - keep the original input first
       - sanitize (avoid 'S.p.A..', etc.)
     """
-    base = _clean_base_for_variants(name)
-    seeds = _maybe_the_variants(base) if base else []
+    # Output depends only on the stripped input; key the cache on it so
+    # padded duplicates ('BASF ', ' BASF') share one entry.
+    return list(_expand_query_variants((name or "").strip()))
 
-    variants: list[str] = []
 
-    def _co_ltd_to_company_limited(s: str) -> list[str]:
-        v = re.sub(
-            r"\bco\b\.?\s*,?\s*ltd\b\.?", "Company Limited", s, flags=re.I
-        )
-        # return both original and expanded if they differ, preserving order
-        return [s] if v == s else [s, v]
-
-    steps: list[Transform] = [
-        _co_ltd_to_company_limited,
-        _canonical_italian_spa,  # SPA dotted + spelled forms
-        _suffix_full_form_variant,  # AG/AB/NV/SA → full form
-        _ensure_dotted_abbrev_variants,  # BV<->B.V., NV<->N.V., SA<->S.A., etc.
-        _swedish_ab_prefix_variants,  # 'SKF AB' -> 'AB SKF' / 'Aktiebolaget SKF'
-        _drop_trailing_single_token_suffix,
-    ]
-
-    variants.extend(_run_pipeline(seeds, steps))
+@lru_cache(maxsize=4096)
+def _expand_query_variants(name: str) -> tuple[str, ...]:
+    base = _clean_base_for_variants(name)
+    seeds = _maybe_the_variants(base) if base else []
 
     seen = set()
     uniq: list[str] = []
@@ -296,8 +337,13 @@ def expand_query_variants(name: str) -> list[str]:
             seen.add(cv)
             uniq.append(cv)
 
-    push((name or "").strip())
+    push(name)
+    if all(map(_is_inert, seeds)):
+        # Plain names ('Microsoft'): every step would echo its input only
+        variants: Iterable[str] = seeds
+    else:
+        variants = _run_pipeline(seeds, _VARIANT_STEPS)
     for v in variants:
         push(v)
 
-    return uniq
+    return tuple(uniq)
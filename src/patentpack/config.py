@@ -7,18 +7,28 @@ No CPC- or operation-specific hardcoding. Use the filename builders below.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Final, List, Optional
+from typing import Dict, Final, List, Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# One snapshot of the environment (after .env is merged) for the import-time
+# knobs below; reload the module to re-read them.
+_ENV: Final[Dict[str, str]] = dict(os.environ)
+
 # -----------------------------------------------------------------------------
 # Storage roots
 # -----------------------------------------------------------------------------
 # XDG cache location: ~/.cache/patentpack (or $XDG_CACHE_HOME/patentpack)
-_XDG_CACHE_HOME = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+# (Path.home() is only resolved when XDG_CACHE_HOME is absent.)
+_XDG_CACHE_HOME = Path(
+    _ENV["XDG_CACHE_HOME"]
+    if "XDG_CACHE_HOME" in _ENV
+    else Path.home() / ".cache"
+)
 CACHE_DIR = _XDG_CACHE_HOME / "patentpack"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -26,8 +36,11 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 # -----------------------------------------------------------------------------
 # Generic filename builders
 # -----------------------------------------------------------------------------
+# The public builders are keyword-only; each forwards to a cached positional
+# helper (Path is immutable, so handing out the same object is safe).
 def _join(base_dir: Optional[Path], fname: str) -> Path:
-    return (base_dir / fname) if base_dir else Path(fname)
+    # One Path(...) call: no intermediate object as with base_dir / fname
+    return Path(base_dir, fname) if base_dir else Path(fname)
 
 
 def per_year_filename(
@@ -40,12 +53,24 @@ def per_year_filename(
     prefix: str = "pp",
     base_dir: Optional[Path] = None,
 ) -> Path:
-    parts = [prefix, op, f"{year:04d}"]
-    if provider:
-        parts.append(provider.lower())
-    if cpc:
-        parts.append(cpc.upper())
-    fname = "_".join(parts) + f".{suffix.lstrip('.')}"
+    return _per_year_filename(
+        year, op, provider, cpc, suffix, prefix, base_dir
+    )
+
+
+@lru_cache(maxsize=4096)
+def _per_year_filename(
+    year: int,
+    op: str,
+    provider: Optional[str],
+    cpc: Optional[str],
+    suffix: str,
+    prefix: str,
+    base_dir: Optional[Path],
+) -> Path:
+    prov = f"_{provider.lower()}" if provider else ""
+    code = f"_{cpc.upper()}" if cpc else ""
+    fname = f"{prefix}_{op}_{year:04d}{prov}{code}.{suffix.lstrip('.')}"
     return _join(base_dir, fname)
 
 
@@ -62,12 +87,21 @@ def panel_filename(
     Panel-style artifact (multi-year/multi-entity), e.g.:
       pp_counts_company_year_uspto_Y02.csv
     """
-    parts = [prefix, op]
-    if provider:
-        parts.append(provider.lower())
-    if cpc:
-        parts.append(cpc.upper())
-    fname = "_".join(parts) + f".{suffix.lstrip('.')}"
+    return _panel_filename(op, provider, cpc, suffix, prefix, base_dir)
+
+
+@lru_cache(maxsize=4096)
+def _panel_filename(
+    op: str,
+    provider: Optional[str],
+    cpc: Optional[str],
+    suffix: str,
+    prefix: str,
+    base_dir: Optional[Path],
+) -> Path:
+    prov = f"_{provider.lower()}" if provider else ""
+    code = f"_{cpc.upper()}" if cpc else ""
+    fname = f"{prefix}_{op}{prov}{code}.{suffix.lstrip('.')}"
     return _join(base_dir, fname)
 
 
@@ -85,46 +119,61 @@ def snapshot_filename(
     Generic snapshot artifact (not tied to a single year), e.g.:
       pp_assignee_discover_uspto_Y02_2025-08-24.csv
     """
-    parts = [prefix, name]
-    if provider:
-        parts.append(provider.lower())
-    if cpc:
-        parts.append(cpc.upper())
-    if when:
-        parts.append(when)
-    fname = "_".join(parts) + f".{suffix.lstrip('.')}"
+    return _snapshot_filename(
+        name, provider, cpc, when, suffix, prefix, base_dir
+    )
+
+
+@lru_cache(maxsize=4096)
+def _snapshot_filename(
+    name: str,
+    provider: Optional[str],
+    cpc: Optional[str],
+    when: Optional[str],
+    suffix: str,
+    prefix: str,
+    base_dir: Optional[Path],
+) -> Path:
+    prov = f"_{provider.lower()}" if provider else ""
+    code = f"_{cpc.upper()}" if cpc else ""
+    tag = f"_{when}" if when else ""
+    fname = f"{prefix}_{name}{prov}{code}{tag}.{suffix.lstrip('.')}"
     return _join(base_dir, fname)
 
 
 # -----------------------------------------------------------------------------
 # HTTP / retry / pacing
 # -----------------------------------------------------------------------------
-DEFAULT_TIMEOUT_S: Final[int] = int(os.getenv("PATENTPACK_TIMEOUT_S", "45"))
+DEFAULT_TIMEOUT_S: Final[int] = int(_ENV.get("PATENTPACK_TIMEOUT_S", "45"))
 
 RETRY_STATUS_FORCELIST: Final[List[int]] = [429, 500, 502, 503, 504]
 RETRY_BACKOFF_FACTOR: Final[float] = float(
-    os.getenv("PATENTPACK_RETRY_BACKOFF", "1.0")
+    _ENV.get("PATENTPACK_RETRY_BACKOFF", "1.0")
 )
 RETRY_ALLOWED_METHODS: Final[List[str]] = ["GET", "POST"]
+# Random extra delay (0..jitter s) per retry so throttled clients spread out
+RETRY_BACKOFF_JITTER: Final[float] = float(
+    _ENV.get("PATENTPACK_RETRY_JITTER", "1.0")
+)
 
 # RPM limits (applied similarly across providers unless overridden)
-DEFAULT_RPM: Final[int] = int(os.getenv("PATENTPACK_DEFAULT_RPM", "40"))
-MAX_RPM: Final[int] = int(os.getenv("PATENTPACK_MAX_RPM", "44"))
+DEFAULT_RPM: Final[int] = int(_ENV.get("PATENTPACK_DEFAULT_RPM", "40"))
+MAX_RPM: Final[int] = int(_ENV.get("PATENTPACK_MAX_RPM", "44"))
 
 # -----------------------------------------------------------------------------
 # Provider base URLs / credentials; overridden by .env vars
 # -----------------------------------------------------------------------------
 # USPTO (PatentsView/PatentSearch)
-PATENTSEARCH_API_URL: Final[str] = os.getenv(
+PATENTSEARCH_API_URL: Final[str] = _ENV.get(
     "PATENTPACK_PV_URL", "https://search.patentsview.org/api/v1/patent/"
 )
-PATENTSEARCHKEY: Final[str] = os.getenv("PATENTPACK_PV_KEY", "")
+PATENTSEARCHKEY: Final[str] = _ENV.get("PATENTPACK_PV_KEY", "")
 
 # EPO OPS
-OPS_AUTH_URL: Final[str] = os.getenv(
+OPS_AUTH_URL: Final[str] = _ENV.get(
     "PATENTPACK_OPS_AUTH_URL", "https://ops.epo.org/3.2/auth/accesstoken"
 )
-OPS_SEARCH_URL: Final[str] = os.getenv(
+OPS_SEARCH_URL: Final[str] = _ENV.get(
     "PATENTPACK_OPS_SEARCH_URL",
     "https://ops.epo.org/3.2/rest-services/published-data/search",
 )
@@ -133,8 +182,12 @@ OPS_SEARCH_URL: Final[str] = os.getenv(
 def get_env(
     name: str, *, required: bool = False, default: Optional[str] = None
 ) -> Optional[str]:
-    """Small helper to fetch env vars with an optional 'required' flag."""
-    val = os.getenv(name, default)
+    """
+    Small helper to fetch env vars with an optional 'required' flag.
+    Reads the live environment (not the import-time snapshot) so credentials
+    exported after import are still picked up.
+    """
+    val = os.environ.get(name, default)
     if required and not val:
         raise RuntimeError(f"Missing required environment variable: {name}")
     return val
@@ -163,6 +216,7 @@ __all__ = [
     "RETRY_STATUS_FORCELIST",
     "RETRY_BACKOFF_FACTOR",
     "RETRY_ALLOWED_METHODS",
+    "RETRY_BACKOFF_JITTER",
     "DEFAULT_RPM",
     "MAX_RPM",
     # providers
@@ -10,13 +10,13 @@ class Provider(str, Enum):
     EPO = "epo"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CountResult:
     total: int
     meta: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Assignee:
     organization: str
     country: Optional[str] = None
@@ -24,6 +24,6 @@ class Assignee:
     city: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssigneeList:
     items: List[Assignee]
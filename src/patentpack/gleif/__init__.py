@@ -3,6 +3,7 @@ GLEIF (Global Legal Entity Identifier Foundation) integration utilities.
 
 This subpackage provides:
 - HTTP client wrappers for the GLEIF API (`http.py`)
+- On-disk cache of GLEIF responses (`cache.py`)
 - Query expansion and normalization for organization names (`normalize/`)
 - Structured parsing of GLEIF API responses (`parse.py`)
 - Candidate matching and ranking rules (`match.py`)
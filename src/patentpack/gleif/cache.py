@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import CACHE_DIR
+from .http import GLEIF_API
+
+# Persistent cache of successful GLEIF responses.
+# Key:   GLEIF_API + canonical (sorted-key) JSON of the query params
+# Value: the decoded response body, stored as JSON text with a timestamp
+# LEI records change slowly, so entries are served for `ttl_s` (default 7d).
+# Failed requests are never stored.
+
+_DEFAULT_PATH = Path(CACHE_DIR) / "gleif_http.sqlite"
+DEFAULT_TTL_S = 7 * 86400
+
+
+class ResponseCache:
+    def __init__(
+        self, path: Optional[Path] = None, ttl_s: float = DEFAULT_TTL_S
+    ) -> None:
+        self.path = path or _DEFAULT_PATH
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, ts REAL NOT NULL, body TEXT NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _key(params: Dict[str, Any]) -> str:
+        return GLEIF_API + "?" + json.dumps(params, sort_keys=True)
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = (
+                self._db()
+                .execute(
+                    "SELECT ts, body FROM responses WHERE key = ?",
+                    (self._key(params),),
+                )
+                .fetchone()
+            )
+        if row is None or time.time() - row[0] > self.ttl_s:
+            return None
+        try:
+            return json.loads(row[1])
+        except ValueError:
+            return None
+
+    def put(self, params: Dict[str, Any], body: Dict[str, Any]) -> None:
+        rec = (self._key(params), time.time(), json.dumps(body))
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, ts, body) "
+                "VALUES (?, ?, ?)",
+                rec,
+            )
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,25 +1,39 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import requests
-from dotenv import load_dotenv
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+if TYPE_CHECKING:
+    import requests
 
-load_dotenv()
+# requests/urllib3/dotenv are imported in make_session(): importing this
+# module (e.g. via gleif.search for cached or offline use) stays cheap.
 
 GLEIF_API = "https://api.gleif.org/api/v1/lei-records"
 _DEFAULT_UA = "patentpack-gleif-client"
 
 
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 def make_session() -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    _load_dotenv()
     s = requests.Session()
     retry = Retry(
         total=6,
         backoff_factor=0.8,
+        backoff_jitter=0.8,  # de-synchronize clients retrying after a 429
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET"],
         raise_on_status=False,
@@ -44,12 +58,17 @@ def safe_get(
     """
     try:
         r = session.get(GLEIF_API, params=params, timeout=30)
+        if getattr(r, "encoding", "") is None:
+            # 'application/vnd.api+json' carries no charset, which makes
+            # requests sniff the whole body for r.text; JSON:API is UTF-8.
+            r.encoding = "utf-8"
         status = r.status_code
-        text_snippet = (r.text or "")[:300].replace("\n", " ")
+        text = r.text or ""  # decoded once, shared by snippet and parse
+        text_snippet = text[:300].replace("\n", " ")
         if status >= 400:
             return (None, status, text_snippet)
         try:
-            return (r.json(), status, text_snippet)
+            return (json.loads(text), status, text_snippet)
         except Exception:
             return (None, status, text_snippet)
     except Exception as e:
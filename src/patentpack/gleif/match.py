@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
 from patentpack.common.orgnorm import (
@@ -20,6 +21,7 @@ PRIORITY = {
     "token_set_eq_legal": 2,  # legal name token-set matches target (low c.)
     "token_set_eq_other": 1,  # one of the variants token-set matches (low c.)
 }
+_TOP_PRIORITY = PRIORITY["exact_norm_legal"]  # the only rule at the top
 
 
 def _normalize_plural_s(stem: str) -> str:
@@ -35,41 +37,79 @@ def _normalize_plural_s(stem: str) -> str:
     return " ".join(out)
 
 
-def rule_for(target_name: str, legal: str, other_names: List[str]) -> str:
-    # comparison-normalized (ADR suffix stripped; diacritics folded; '&' normalized; stopwords handled in stem)
+@dataclass(frozen=True)
+class _TargetKey:
+    """Target-side comparison forms, computed once per pick_top_matches()."""
+
+    tn: str  # cmp_norm(target)
+    tn_u: str  # tn without dots
+    ts: str  # plural-collapsed cmp_stem(target)
+    tokens: frozenset[str]  # token set of cmp_stem(target)
+
+
+def _undot(x: str) -> str:
+    # dot-insensitive "exact" equality (handles Inc vs Inc., NV vs N.V., etc.)
+    # Most normalized names carry no dot; the membership test is cheaper
+    # than a replace() scan that finds nothing.
+    return x.replace(".", "") if "." in x else x
+
+
+def _toks(x: str) -> frozenset[str]:
+    # token-set equality (stopwords removed via stem())
+    return frozenset(t for t in SPACE_RE.split(cmp_stem(x)) if t)
+
+
+def _make_target_key(target_name: str) -> _TargetKey:
     tn = cmp_norm(target_name)
-    ts = _normalize_plural_s(cmp_stem(target_name))
-    l_n = cmp_norm(legal)
-    l_s = _normalize_plural_s(cmp_stem(legal))
+    return _TargetKey(
+        tn=tn,
+        tn_u=_undot(tn),
+        ts=_normalize_plural_s(cmp_stem(target_name)),
+        tokens=_toks(target_name),
+    )
+
+
+def rule_for(target_name: str, legal: str, other_names: List[str]) -> str:
+    return _rule_for_key(_make_target_key(target_name), legal, other_names)
 
-    # --- dot-insensitive "exact" equality (handles Inc vs Inc., NV vs N.V., etc.) ---
-    def undot(x: str) -> str:
-        return x.replace(".", "")
 
-    tn_u = undot(tn)
-    l_n_u = undot(l_n)
+def _rule_for_key(
+    tk: _TargetKey,
+    legal: str,
+    other_names: List[str],
+    exact_legal_only: bool = False,
+) -> str:
+    """
+    Rules are tried strongest first and the first hit wins, so each check
+    only runs when every stronger one missed. With `exact_legal_only`,
+    stop after the exact legal check (the caller already holds a top-rank
+    candidate and nothing weaker can join it).
+    """
+    # comparison-normalized (ADR suffix stripped; diacritics folded; '&' normalized; stopwords handled in stem)
+    tn, tn_u, ts = tk.tn, tk.tn_u, tk.ts
+    l_n = cmp_norm(legal)
+    l_n_u = _undot(l_n)
 
     if (l_n == tn and l_n) or (l_n_u == tn_u and l_n_u):
         return "exact_norm_legal"
+    if exact_legal_only:
+        return ""
 
-    for on in other_names:
-        on_n = cmp_norm(on)
-        if (on_n == tn and tn) or (undot(on_n) == tn_u and tn_u):
-            return "exact_norm_other"
+    if tn:  # an empty target (hence empty tn_u) cannot equal anything
+        for on in other_names:
+            on_n = cmp_norm(on)
+            if on_n == tn or (tn_u and _undot(on_n) == tn_u):
+                return "exact_norm_other"
 
     # stem equality on legal (stopwords removed inside stem)
-    if l_s == ts and ts:
+    if ts and _normalize_plural_s(cmp_stem(legal)) == ts:
         return "stem_eq_legal"
 
-    # token-set equality (stopwords removed via stem())
-    def toks(x: str) -> set[str]:
-        return set(t for t in SPACE_RE.split(cmp_stem(x)) if t)
-
-    t0 = toks(target_name)
-    if t0 and toks(legal) == t0:
+    t0 = tk.tokens
+    if t0 and _toks(legal) == t0:
         return "token_set_eq_legal"
     for on in other_names:
-        if t0 and toks(on) == t0:
+        if t0 and _toks(on) == t0:
             return "token_set_eq_other"
 
     return ""
@@ -86,54 +126,58 @@ def pick_top_matches(
     had_candidates = bool(rows)
     any_adr = False
     any_ascii = False
+    tk = _make_target_key(target_name)
 
-    raw_cands: List[Tuple[str, Dict[str, str], bool]] = []
+    # Single pass: keep only non-ADR candidates at the best priority so far
+    # (in row order); the ADR/ASCII flags feed the empty-result status.
+    top_score = -1
+    top_d: List[Dict[str, str]] = []
 
     for d in rows:
         lei = d.get("id") or (d.get("attributes", {}) or {}).get("lei") or ""
         legal, others, hq_country = extract_names(d)
 
-        names_for_checks = [legal] + others
-        if any(
-            is_adr_like_name((n or "").lower()) for n in names_for_checks if n
-        ):
+        names_for_checks = [n for n in [legal, *others] if n]
+        adr_like = any(is_adr_like_name(n.lower()) for n in names_for_checks)
+        if adr_like:
             any_adr = True
-        if any(name_has_ascii(n or "") for n in names_for_checks if n):
+        if not any_ascii and any(map(name_has_ascii, names_for_checks)):
             any_ascii = True
 
-        rule = rule_for(target_name, legal, others)
-        if rule and lei:
-            adr_like = any(
-                is_adr_like_name((n or "").lower())
-                for n in names_for_checks
-                if n
-            )
-            raw_cands.append(
-                (
-                    rule,
-                    {
-                        "lei": lei,
-                        "legal": legal,
-                        "hq_country": hq_country,
-                        "rule": rule,
-                    },
-                    adr_like,
-                )
-            )
-
-    # prefer non-ADR
-    cands = [c for c in raw_cands if not c[2]]
-    if not cands:
+        # prefer non-ADR
+        if adr_like or not lei:
+            continue
+        # Nothing ranks above exact_norm_legal: once held, only ties matter
+        rule = _rule_for_key(
+            tk,
+            legal,
+            others,
+            exact_legal_only=top_score >= _TOP_PRIORITY,
+        )
+        if not rule:
+            continue
+        score = PRIORITY[rule]  # every non-empty rule is a key
+        if score < top_score:
+            continue
+        cand = {
+            "lei": lei,
+            "legal": legal,
+            "hq_country": hq_country,
+            "rule": rule,
+        }
+        if score > top_score:
+            top_score = score
+            top_d = [cand]
+        else:
+            top_d.append(cand)
+
+    if not top_d:
         if had_candidates and any_adr:
             return ([], "adr_only_candidates", "")
         if had_candidates and not any_ascii:
             return ([], "non_latin_only", "")
         return ([], "no_match", "")
 
-    top_score = max(PRIORITY.get(rule, 0) for rule, _, _ in cands)
-    top = [c for c in cands if PRIORITY.get(c[0], 0) == top_score]
-    top_d = [c[1] for c in top]
-
     if len(top_d) == 1:
         return (top_d, "ok", top_d[0]["rule"])
     else:
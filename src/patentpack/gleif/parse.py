@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
+
+# Shared read-only stand-in for a missing/empty sub-object (no per-call {})
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
 def as_legal_name(obj: Any) -> str:
@@ -14,18 +18,21 @@ def as_legal_name(obj: Any) -> str:
 
 def as_other_names(arr: Any) -> List[str]:
     out: List[str] = []
-    if isinstance(arr, list):
-        for x in arr:
-            if isinstance(x, dict):
-                nm = x.get("name", "")
-                nm = (nm or "").strip()
-                if isinstance(nm, str) and nm:
-                    out.append(nm)
-            elif isinstance(x, str):
-                nm = x.strip()
-                if nm:
-                    out.append(nm)
-            # else: ignore non-strings like numbers, None, etc.
+    if not arr or not isinstance(arr, list):
+        return out
+    append = out.append
+    for x in arr:
+        if isinstance(x, dict):
+            nm = x.get("name")
+            if not nm:
+                continue
+        elif isinstance(x, str):
+            nm = x
+        else:
+            continue  # ignore non-strings like numbers, None, etc.
+        nm = nm.strip()
+        if nm:
+            append(nm)
     return out
 
 
@@ -33,8 +40,8 @@ def extract_names(d: Dict) -> Tuple[str, List[str], str]:
     """
     Return (legal, other_names, hq_country) pulling from attributes. OR attributes.entity.
     """
-    attr = d.get("attributes", {}) or {}
-    ent = attr.get("entity", {}) or {}
+    attr = d.get("attributes") or _EMPTY
+    ent = attr.get("entity") or _EMPTY
 
     legal = as_legal_name(attr.get("legalName")) or as_legal_name(
         ent.get("legalName")
@@ -42,10 +49,8 @@ def extract_names(d: Dict) -> Tuple[str, List[str], str]:
     others = as_other_names(attr.get("otherNames")) or as_other_names(
         ent.get("otherNames")
     )
-    hq = (
-        attr.get("headquartersAddress") or ent.get("headquartersAddress") or {}
-    ) or {}
-    hq_country = (hq.get("country") or "").upper()
+    hq = attr.get("headquartersAddress") or ent.get("headquartersAddress")
+    hq_country = (hq.get("country") or "").upper() if hq else ""
     return legal, others, hq_country
 
 
@@ -53,8 +58,8 @@ def pretty_first_record(rows: List[Dict]) -> str:
     if not rows:
         return "(no rows)"
     d = rows[0]
-    attr = d.get("attributes", {}) or {}
-    ent = attr.get("entity", {}) or {}
+    attr = d.get("attributes") or _EMPTY
+    ent = attr.get("entity") or _EMPTY
     sample = {
         "id": d.get("id"),
         "legalName": attr.get("legalName") or ent.get("legalName"),
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from patentpack.common.orgnorm import (
     country_hints_from_name,
     expand_query_variants,
 )
 
+from .cache import ResponseCache
 from .http import safe_get
 
 
@@ -16,6 +18,8 @@ def gleif_search_union(
     name: str,
     page_size: int = 200,
     debug: bool = False,
+    cache: Optional[ResponseCache] = None,
+    max_workers: int = 1,
 ) -> List[Dict]:
     """
     Query multiple filters, union results, dedupe by LEI.
@@ -29,6 +33,12 @@ def gleif_search_union(
     entities/diacritics, canonicalizes '&'↔'and', handles 'C.'↔'C',
     expands legal forms (e.g., 'AG'↔'Aktiengesellschaft', 'SpA'↔'S.p.A.'),
     and drops trailing '/NY', '/DE', '/The', etc.
+
+    With a `cache`, successful responses are reused across runs and only
+    misses (or failures) go to the network. Misses are fetched one at a
+    time, or on up to `max_workers` threads sharing `session` (opt-in,
+    > 1); results are still merged in query order, so the union is
+    deterministic.
     """
     seen: set[str] = set()
     out: List[Dict] = []
@@ -67,16 +77,48 @@ def gleif_search_union(
     for v in variants:
         queries.append({"filter[fulltext]": v, "page[size]": str(page_size)})
 
-    # Execute and union-dedupe by LEI
+    # Drop repeated queries (e.g. duplicate variants or country hints)
+    seen_q: set[tuple] = set()
+    unique_queries: List[dict] = []
     for q in queries:
-        j, status, body = safe_get(session, q)
+        key = tuple(sorted(q.items()))
+        if key not in seen_q:
+            seen_q.add(key)
+            unique_queries.append(q)
+    queries = unique_queries
+
+    # Execute (cache first, then misses concurrently)
+    results: List[Optional[Dict]] = [
+        cache.get(q) if cache is not None else None for q in queries
+    ]
+    misses = [q for q, j in zip(queries, results) if j is None]
+    workers = min(max_workers, len(misses))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            fetched = list(ex.map(lambda q: safe_get(session, q), misses))
+    else:
+        fetched = [safe_get(session, q) for q in misses]
+
+    it = iter(fetched)
+    for i, j in enumerate(results):
+        if j is not None:
+            continue
+        j, status, body = next(it)
         if j is None:
             if debug:
                 print(
-                    f"[gleif] HTTP {status} for {q} | body: {body}",
+                    f"[gleif] HTTP {status} for {queries[i]} | body: {body}",
                     file=sys.stderr,
                 )
             continue
+        if cache is not None:
+            cache.put(queries[i], j)
+        results[i] = j
+
+    # Union-dedupe by LEI, in query order
+    for j in results:
+        if j is None:
+            continue
         data = j.get("data", []) or []
         for d in data:
             lei = d.get("id") or (d.get("attributes", {}) or {}).get("lei")
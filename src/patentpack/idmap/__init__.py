@@ -27,7 +27,7 @@ from .types import (
     PlanOptions,
     VariantItem,
 )
-from .variants import build_bucketed_variants
+from .variants import build_bucketed_variants, build_bucketed_variants_soa
 
 __all__ = [
     "Bucket",
@@ -37,6 +37,7 @@ __all__ = [
     "NamePlan",
     "NamePlanResult",
     "build_bucketed_variants",
+    "build_bucketed_variants_soa",
     "discover_orgs_via_begins",
     "eq_count",
     "plan_names",
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:  # POSIX: cross-process lock around appends and compaction
+    import fcntl
+except ImportError:  # pragma: no cover - e.g. Windows: process-local only
+    fcntl = None  # type: ignore[assignment]
 
 from ..config import CACHE_DIR
 
@@ -16,10 +24,33 @@ from ..config import CACHE_DIR
 #   discover -> {"has_hits": bool}  # True if any names were found in discovery
 #   eq       -> {"has_hits": bool}  # True if count > 0
 #
-# NOTE: intentionally simple; upgrade to sqlite if/when needed.
+# NOTE: intentionally simple. The file is append-only, so updates leave
+# superseded lines behind; _load() compacts it once those dominate.
 
 _DEFAULT_PATH = Path(CACHE_DIR) / "idmap_cache.jsonl"
-_LOCK = threading.Lock()
+# One lock per cache file (by absolute path): instances sharing a file
+# serialize their I/O, unrelated caches don't contend. Across processes,
+# the same sections also hold an flock on the sidecar "<file>.lock".
+_LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+# Rewrite on load when the file has > _COMPACT_RATIO lines per live key
+# (and at least _COMPACT_MIN_LINES lines, so small files are left alone)
+_COMPACT_MIN_LINES = 1000
+_COMPACT_RATIO = 2
+
+
+def _file_sig(st: os.stat_result) -> Tuple[int, int, int]:
+    # identity + extent: changes on another process's append or replace
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    key = os.path.abspath(path)
+    with _LOCKS_GUARD:
+        lock = _LOCKS.get(key)
+        if lock is None:
+            lock = _LOCKS[key] = threading.Lock()
+        return lock
 
 
 @dataclass(frozen=True)
@@ -35,6 +66,63 @@ class NamePlanCache:
         self.path = path or _DEFAULT_PATH
         self._loaded = False
         self._mem: Dict[Tuple[str, int, str, str], Dict[str, Any]] = {}
+        self._lock = _lock_for(self.path)
+        self._dir_ready = False  # parent dir created (first lock only)
+
+    @staticmethod
+    def _record(
+        key_tuple: Tuple[str, int, str, str], val: Dict[str, Any]
+    ) -> str:
+        provider, year, op, key = key_tuple
+        rec = {
+            "provider": provider,
+            "year": year,
+            "op": op,
+            "key": key,
+            "val": val,
+        }
+        return json.dumps(rec, ensure_ascii=False) + "\n"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the file's thread lock and (POSIX) its cross-process flock."""
+        with self._lock:
+            if not self._dir_ready:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+            if fcntl is None:
+                yield
+                return
+            lock_path = self.path.with_name(self.path.name + ".lock")
+            with open(lock_path, "a") as lf:
+                fcntl.flock(lf, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lf, fcntl.LOCK_UN)
+
+    def _compact(self, seen: os.stat_result) -> None:
+        """Rewrite the file with one line per live key (caller holds lock).
+
+        `seen` is the file's stat from before it was read. Under the flock
+        no other process can append or compact in between; without fcntl
+        the check below is the fallback, dropping the rewrite (left to a
+        later load) if the file changed since it was read.
+        """
+        fd, tmp = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.writelines(self._record(k, v) for k, v in self._mem.items())
+            os.chmod(tmp, seen.st_mode & 0o777)  # mkstemp creates 0600
+            if _file_sig(os.stat(self.path)) == _file_sig(seen):
+                os.replace(tmp, self.path)
+                return
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        os.unlink(tmp)
 
     def _load(self) -> None:
         if self._loaded:
@@ -42,12 +130,17 @@ class NamePlanCache:
         if not self.path.exists():
             self._loaded = True
             return
-        with _LOCK:
+        with self._locked():
+            if self._loaded:  # another thread finished loading first
+                return
+            n_lines = 0
+            seen = os.stat(self.path)
             with self.path.open("r", encoding="utf-8") as fh:
                 for line in fh:
                     line = line.strip()
                     if not line:
                         continue
+                    n_lines += 1
                     try:
                         rec = json.loads(line)
                         k = (
@@ -59,7 +152,12 @@ class NamePlanCache:
                         self._mem[k] = rec["val"]
                     except Exception:
                         continue
-        self._loaded = True
+            if (
+                n_lines >= _COMPACT_MIN_LINES
+                and n_lines > _COMPACT_RATIO * len(self._mem)
+            ):
+                self._compact(seen)
+            self._loaded = True
 
     def get(self, k: CacheKey) -> Optional[Dict[str, Any]]:
         self._load()
@@ -69,17 +167,18 @@ class NamePlanCache:
         self._load()
         key_tuple = (k.provider, k.year, k.op, k.key)
         self._mem[key_tuple] = val
-        rec = {
-            "provider": k.provider,
-            "year": k.year,
-            "op": k.op,
-            "key": k.key,
-            "val": val,
-        }
-        with _LOCK:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = self._record(key_tuple, val)
+        with self._locked():
             with self.path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                fh.write(line)
+
+    def get_has_hits(self, k: CacheKey) -> Optional[bool]:
+        """The has_hits flag of a cached query, or None if it isn't cached."""
+        self._load()
+        val = self._mem.get((k.provider, k.year, k.op, k.key))
+        if val is None:
+            return None
+        return bool(val.get("has_hits", False))
 
     def has_hits(self, k: CacheKey) -> bool:
         """Check if a query has had any hits (discovery or EQ)."""
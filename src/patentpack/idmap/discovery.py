@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 from .providers import _post, _year_bounds
 
+_ASCII_ALNUM_RUN_RE = re.compile(r"[A-Za-z0-9]+")
 
+
+@lru_cache(maxsize=4096)
 def _norm_words(s: str) -> str:
     """
     Normalize to lower + word boundaries (collapse non-alnum to single spaces).
@@ -12,6 +17,10 @@ def _norm_words(s: str) -> str:
     """
     if not s:
         return ""
+    if s.isascii():
+        # Fast path; for ASCII, lowering the joined runs equals lowering
+        # char by char (not so for e.g. 'İ' or a word-final 'Σ' below)
+        return " ".join(_ASCII_ALNUM_RUN_RE.findall(s)).lower()
 
     out: list[str] = []
     prev_space = False
@@ -61,29 +70,38 @@ def discover_orgs_via_begins(
 
     want_raw = (prefix or "").strip()
     want_words = _norm_words(prefix)
+    wl = len(want_words)
+
+    # Stripped organization strings, in response order (non-strings and
+    # empty values dropped), so the filter below only sees clean input
+    orgs = (
+        org.strip()
+        for p in data.get("patents") or []
+        for a in p.get("assignees") or []
+        if isinstance(org := a.get("assignee_organization"), str) and org
+    )
 
     out: List[str] = []
     seen: set[str] = set()
-    for p in data.get("patents") or []:
-        for a in p.get("assignees") or []:
-            org = a.get("assignee_organization")
-            if not isinstance(org, str) or not org:
-                continue
-            org_raw = org.strip()
-            raw_ok = bool(want_raw) and org_raw.startswith(want_raw)
+    for org_raw in orgs:
+        if org_raw in seen:
+            continue
+        # The raw prefix test is cheap; normalize only when it fails
+        if want_raw and org_raw.startswith(want_raw):
+            keep = True
+        elif wl:
             ow = _norm_words(org_raw)
-            if want_words:
-                starts = ow.startswith(want_words)
-                boundary_ok = starts and (
-                    len(ow) == len(want_words) or ow[len(want_words)] == " "
-                )
-            else:
-                boundary_ok = False
-
-            if raw_ok or boundary_ok:
-                if org_raw not in seen:
-                    seen.add(org_raw)
-                    out.append(org_raw)
+            # Word-boundary prefix test. `ow` is single-spaced with no
+            # leading space, so a slice compare plus one char check is the
+            # whole job; an anchored re.match is no faster on these short
+            # strings.
+            keep = ow[:wl] == want_words and (len(ow) == wl or ow[wl] == " ")
+        else:
+            keep = False
+
+        if keep:
+            seen.add(org_raw)
+            out.append(org_raw)
     return out
 
 
@@ -16,15 +16,23 @@ Strategies:
   - "eq_then_discovery" (default):
       run exact on seeds (orig, gleif_legal, gleif_other, gleif_sub),
       if none hit, run discovery for (orig → gleif_legal → gleif_other → expand_*),
-      firing eq on each harvested org immediately.
+      firing eq on each harvested org immediately. Discovery runs regardless
+      unless ResolveConfig.stop_on_first_hit is set, which ends the stream
+      after the seed eq pass once any seed had a non-zero total.
   - "discovery_first_for_seeds":
       for seeds in (orig, gleif_legal, gleif_other) run discovery, eq on finds, then
       fall back to exact eq on seeds that had no discovery results; finally do expand_* discovery.
 """
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
 from typing import (
     Any,
+    Callable,
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -80,6 +88,13 @@ NameEvent = Union[EqAttemptResult, DiscoveryResult]
 # --- lightweight cache adapter around NamePlanCache ---
 
 
+@lru_cache(maxsize=4096)
+def _mk_key(provider: str, year: int, op: str, key: str) -> CacheKey:
+    # CacheKey is frozen (hence immutable and safe to share); a cache hit
+    # skips the dataclass __init__, which every get/put would pay again
+    return CacheKey(provider=provider, year=year, op=op, key=key)
+
+
 class _Cache:
     def __init__(self, store: Optional[NamePlanCache] = None) -> None:
         self.store = store or NamePlanCache()
@@ -91,9 +106,7 @@ class _Cache:
     def get_eq(
         self, provider_label: str, year: Optional[int], name: str
     ) -> Optional[int]:
-        k = CacheKey(
-            provider=provider_label, year=self._year(year), op="eq", key=name
-        )
+        k = _mk_key(provider_label, self._year(year), "eq", name)
         if self.store.has_hits(k):
             # Return a placeholder count since we only track has_hits now
             return 1
@@ -102,20 +115,13 @@ class _Cache:
     def put_eq(
         self, provider_label: str, year: Optional[int], name: str, count: int
     ) -> None:
-        k = CacheKey(
-            provider=provider_label, year=self._year(year), op="eq", key=name
-        )
+        k = _mk_key(provider_label, self._year(year), "eq", name)
         self.store.mark_has_hits(k, count > 0)
 
     def get_discovery(
         self, provider_label: str, year: Optional[int], seed: str
     ) -> Optional[List[str]]:
-        k = CacheKey(
-            provider=provider_label,
-            year=self._year(year),
-            op="discover",
-            key=seed,
-        )
+        k = _mk_key(provider_label, self._year(year), "discover", seed)
         if self.store.has_hits(k):
             # Return a placeholder list since we only track has_hits now
             return ["cached_hit"]
@@ -128,22 +134,18 @@ class _Cache:
         seed: str,
         found: Iterable[str],
     ) -> None:
-        k = CacheKey(
-            provider=provider_label,
-            year=self._year(year),
-            op="discover",
-            key=seed,
-        )
-        has_hits = len(list(found or [])) > 0
+        k = _mk_key(provider_label, self._year(year), "discover", seed)
+        if isinstance(found, (list, tuple)):  # what the strategies pass
+            has_hits = bool(found)
+        else:  # any other iterable: one item is enough, don't copy it
+            has_hits = any(True for _ in found or ())
         self.store.mark_has_hits(k, has_hits)
 
     def has_hits(
         self, provider_label: str, year: Optional[int], op: str, key: str
     ) -> bool:
         """Check if a query has had any hits."""
-        k = CacheKey(
-            provider=provider_label, year=self._year(year), op=op, key=key
-        )
+        k = _mk_key(provider_label, self._year(year), op, key)
         return self.store.has_hits(k)
 
 
@@ -152,6 +154,11 @@ class ResolveConfig:
     strategy: str = "eq_then_discovery"
     discovery_limit: int = 120
     debug: bool = False
+    # in-flight count_eq calls (1 = strictly sequential, the default); the
+    # provider's own rate limiter still bounds the request rate
+    max_concurrency: int = 1
+    # eq_then_discovery: skip discovery entirely when a seed eq already hit
+    stop_on_first_hit: bool = False
 
 
 class NameResolver:
@@ -164,6 +171,21 @@ class NameResolver:
         self.provider = provider
         self.cache = _Cache(cache)
         self.provider_label = provider_label  # for cache keys
+        self._pool: Optional[ThreadPoolExecutor] = None  # shared by resolves
+        self._pool_size = 0
+
+    def close(self) -> None:
+        """Shut down the worker pool used for concurrent eq lookups."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pool_size = 0
+
+    def __enter__(self) -> "NameResolver":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     # ---------- Core public API ----------
 
@@ -176,6 +198,8 @@ class NameResolver:
         strategy: str = "eq_then_discovery",
         discovery_limit: int = 120,
         debug: bool = False,
+        max_concurrency: int = 1,
+        stop_on_first_hit: bool = False,
     ) -> Iterator[NameEvent]:
         """
         Yield NameEvent items describing everything we do (eq attempts + discoveries).
@@ -183,66 +207,216 @@ class NameResolver:
         what to do with the stream.
         """
         cfg = ResolveConfig(
-            strategy=strategy, discovery_limit=discovery_limit, debug=debug
+            strategy=strategy,
+            discovery_limit=discovery_limit,
+            debug=debug,
+            max_concurrency=max_concurrency,
+            stop_on_first_hit=stop_on_first_hit,
         )
 
         # Plan print (debug only)
         if cfg.debug:
-            print(
-                f"[variants-plan] y={year or '-'} (N={len(candidates)})",
-                flush=True,
-            )
+            # one write + flush for the whole plan, not one per variant
             prio = {b: i for i, b in enumerate(ALL_BUCKETS)}
-            for v, b in sorted(candidates, key=lambda t: prio.get(t[1], 999)):
-                print(f"    - [{b:<13}] {v}  ->  (queued)", flush=True)
+            lines = [f"[variants-plan] y={year or '-'} (N={len(candidates)})"]
+            lines.extend(
+                f"    - [{b:<13}] {v}  ->  (queued)"
+                for v, b in sorted(
+                    candidates, key=lambda t: prio.get(t[1], 999)
+                )
+            )
+            print("\n".join(lines), flush=True)
+
+        # Bucket -> variants (candidate order), built once for all stages
+        by_bucket: Dict[str, List[str]] = {}
+        for v, b in candidates:
+            by_bucket.setdefault(b, []).append(v)
 
         # Strategy dispatch
         if cfg.strategy == "eq_then_discovery":
             yield from self._resolve_eq_then_discovery(
-                base_query, year, candidates, cfg
+                base_query, year, by_bucket, cfg
             )
         elif cfg.strategy == "discovery_first_for_seeds":
             yield from self._resolve_discovery_first_for_seeds(
-                base_query, year, candidates, cfg
+                base_query, year, by_bucket, cfg
             )
         else:
             raise ValueError(f"Unknown strategy: {cfg.strategy}")
 
+    # ---------- Batched eq lookups ----------
+
+    def _executor(self, size: int) -> ThreadPoolExecutor:
+        if self._pool is None or self._pool_size != size:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix="name-resolver"
+            )
+            self._pool_size = size
+        return self._pool
+
+    def _windowed(
+        self, fn: Callable[[str], int], names: List[str], size: int
+    ) -> Iterator[int]:
+        """
+        fn(name) for each name, in order, with at most `size` calls in
+        flight. A call is submitted only as an earlier result is consumed,
+        so a consumer that stops early leaves no queued requests behind.
+        """
+        pool = self._executor(size)
+        rest = iter(names)
+        window: Deque[Future] = deque(
+            pool.submit(fn, n) for n in islice(rest, size)
+        )
+        try:
+            while window:
+                total = window.popleft().result()
+                for n in islice(rest, 1):
+                    window.append(pool.submit(fn, n))
+                yield total
+        finally:
+            for fut in window:
+                fut.cancel()
+
+    def _eq_totals(
+        self, year: Optional[int], names: List[str], cfg: ResolveConfig
+    ) -> Iterator[int]:
+        """
+        Yield the eq total for each name, in order. Cache misses have no
+        data dependency on each other, so with max_concurrency > 1 up to
+        that many run ahead of the consumer; results (and cache writes) are
+        still consumed in input order on the calling thread.
+        """
+        label = self.provider_label
+        cached = [self.cache.get_eq(label, year, n) for n in names]
+        pending = list(
+            dict.fromkeys(n for n, c in zip(names, cached) if c is None)
+        )
+        ahead: Optional[Iterator[int]] = None
+        if cfg.max_concurrency > 1 and len(pending) > 1:
+            count = partial(self.provider.count_eq, year=year)
+            ahead = self._windowed(count, pending, cfg.max_concurrency)
+
+        fetched: Dict[str, int] = {}
+        try:
+            for name, total in zip(names, cached):
+                if total is None:
+                    if name not in fetched:
+                        # `pending` is in first-miss order: `ahead` lines up
+                        fetched[name] = (
+                            next(ahead)
+                            if ahead is not None
+                            else self.provider.count_eq(name, year=year)
+                        )
+                        self.cache.put_eq(label, year, name, fetched[name])
+                        total = fetched[name]
+                    else:
+                        # a repeat reads back what get_eq would now return
+                        total = 1 if fetched[name] > 0 else fetched[name]
+                yield total
+        finally:
+            stop = getattr(ahead, "close", None)
+            if stop is not None:  # drop look-ahead nobody will consume
+                stop()
+
+    # ---------- Event helpers (shared by the strategies) ----------
+
+    def _eq_events(
+        self,
+        base_query: str,
+        year: Optional[int],
+        items: List[Tuple[str, str]],
+        cfg: ResolveConfig,
+    ) -> Iterator[EqAttemptResult]:
+        """Eq on each (variant, bucket), as one _eq_totals batch."""
+        totals = self._eq_totals(year, [v for v, _ in items], cfg)
+        for (variant, bucket), total in zip(items, totals):
+            if cfg.debug:
+                print(
+                    f"[eq] y={year or '-'} try={variant!r} bucket={bucket} -> total={total}",
+                    flush=True,
+                )
+            yield EqAttemptResult(
+                base_query=base_query,
+                year=year,
+                variant=variant,
+                bucket=bucket,
+                total=total,
+                meta={},
+            )
+
+    def _discover_then_eq(
+        self,
+        base_query: str,
+        year: Optional[int],
+        bucket: str,
+        seeds: List[str],
+        cfg: ResolveConfig,
+        disc_by_seed: Optional[Dict[str, List[str]]] = None,
+    ) -> Iterator[NameEvent]:
+        """
+        For each seed: cache-aware discovery, then eq on every distinct
+        harvested org. Records harvests in `disc_by_seed` when given.
+        """
+        for seed in seeds:
+            cached_disc = self.cache.get_discovery(
+                self.provider_label, year, seed
+            )
+            if cached_disc is None:
+                harvested = self.provider.discover_prefix(
+                    seed, year=year, limit=cfg.discovery_limit
+                )
+                self.cache.put_discovery(
+                    self.provider_label, year, seed, harvested
+                )
+            else:
+                harvested = cached_disc
+            if disc_by_seed is not None:
+                disc_by_seed[seed] = harvested
+
+            if cfg.debug:
+                sample = ", ".join(harvested[:3]) if harvested else "-"
+                print(
+                    f"[discover] y={year or '-'} prefix={seed!r} bucket={bucket} -> harvested={len(harvested)} sample=[{sample}]",
+                    flush=True,
+                )
+            yield DiscoveryResult(
+                base_query=base_query,
+                year=year,
+                seed=seed,
+                bucket=bucket,
+                harvested=list(harvested),
+                meta={},
+            )
+
+            orgs = dict.fromkeys(harvested)  # dedup, keep order
+            yield from self._eq_events(
+                base_query, year, [(org, bucket) for org in orgs], cfg
+            )
+
     # ---------- Strategies ----------
 
     def _resolve_eq_then_discovery(
         self,
         base_query: str,
         year: Optional[int],
-        candidates: List[Tuple[str, str]],
+        by_bucket: Dict[str, List[str]],
         cfg: ResolveConfig,
     ) -> Iterator[NameEvent]:
         # Stage A: exact on *seeds only* (no expansions)
-        for bucket in SEED_BUCKETS:
-            for variant, b in candidates:
-                if b != bucket:
-                    continue
-                cached = self.cache.get_eq(self.provider_label, year, variant)
-                if cached is None:
-                    total = self.provider.count_eq(variant, year=year)
-                    self.cache.put_eq(
-                        self.provider_label, year, variant, total
-                    )
-                else:
-                    total = cached
-                if cfg.debug:
-                    print(
-                        f"[eq] y={year or '-'} try={variant!r} bucket={b} -> total={total}",
-                        flush=True,
-                    )
-                yield EqAttemptResult(
-                    base_query=base_query,
-                    year=year,
-                    variant=variant,
-                    bucket=b,
-                    total=total,
-                    meta={},
-                )
+        seed_items = [
+            (variant, bucket)
+            for bucket in SEED_BUCKETS
+            for variant in by_bucket.get(bucket, ())
+        ]
+        any_hit = False
+        for ev in self._eq_events(base_query, year, seed_items, cfg):
+            any_hit = any_hit or ev.total > 0
+            yield ev
+
+        if cfg.stop_on_first_hit and any_hit:
+            return
 
         # Stage B: discovery (no subsidiaries)
         for bucket in [
@@ -253,222 +427,34 @@ class NameResolver:
             "expand_other",
             "expand_orig",
         ]:
-            seeds = [v for (v, b) in candidates if b == bucket]
-            for seed in seeds:
-                cached_disc = self.cache.get_discovery(
-                    self.provider_label, year, seed
-                )
-                if cached_disc is None:
-                    harvested = self.provider.discover_prefix(
-                        seed, year=year, limit=cfg.discovery_limit
-                    )
-                    self.cache.put_discovery(
-                        self.provider_label, year, seed, harvested
-                    )
-                else:
-                    harvested = cached_disc
-
-                if cfg.debug:
-                    sample = ", ".join(harvested[:3]) if harvested else "-"
-                    print(
-                        f"[discover] y={year or '-'} prefix={seed!r} bucket={bucket} -> harvested={len(harvested)} sample=[{sample}]",
-                        flush=True,
-                    )
-                yield DiscoveryResult(
-                    base_query=base_query,
-                    year=year,
-                    seed=seed,
-                    bucket=bucket,
-                    harvested=list(harvested),
-                    meta={},
-                )
-
-                seen: set[str] = set()
-                for org in harvested:
-                    if org in seen:
-                        continue
-                    seen.add(org)
-                    cached_eq = self.cache.get_eq(
-                        self.provider_label, year, org
-                    )
-                    if cached_eq is None:
-                        total = self.provider.count_eq(org, year=year)
-                        self.cache.put_eq(
-                            self.provider_label, year, org, total
-                        )
-                    else:
-                        total = cached_eq
-                    if cfg.debug:
-                        print(
-                            f"[eq] y={year or '-'} try={org!r} bucket={bucket} -> total={total}",
-                            flush=True,
-                        )
-                    yield EqAttemptResult(
-                        base_query=base_query,
-                        year=year,
-                        variant=org,
-                        bucket=bucket,
-                        total=total,
-                        meta={},
-                    )
+            yield from self._discover_then_eq(
+                base_query, year, bucket, by_bucket.get(bucket, []), cfg
+            )
 
     def _resolve_discovery_first_for_seeds(
         self,
         base_query: str,
         year: Optional[int],
-        candidates: List[Tuple[str, str]],
+        by_bucket: Dict[str, List[str]],
         cfg: ResolveConfig,
     ) -> Iterator[NameEvent]:
-        # Stage A: discovery for seeds
+        # Stage A: discovery for seeds (eq on harvested first)
+        disc_by_seed: Dict[str, List[str]] = {}  # seed -> harvested
         for bucket in ["orig", "gleif_legal", "gleif_other"]:
-            seeds = [v for (v, b) in candidates if b == bucket]
-            for seed in seeds:
-                cached_disc = self.cache.get_discovery(
-                    self.provider_label, year, seed
-                )
-                if cached_disc is None:
-                    harvested = self.provider.discover_prefix(
-                        seed, year=year, limit=cfg.discovery_limit
-                    )
-                    self.cache.put_discovery(
-                        self.provider_label, year, seed, harvested
-                    )
-                else:
-                    harvested = cached_disc
-
-                if cfg.debug:
-                    sample = ", ".join(harvested[:3]) if harvested else "-"
-                    print(
-                        f"[discover] y={year or '-'} prefix={seed!r} bucket={bucket} -> harvested={len(harvested)} sample=[{sample}]",
-                        flush=True,
-                    )
-                yield DiscoveryResult(
-                    base_query=base_query,
-                    year=year,
-                    seed=seed,
-                    bucket=bucket,
-                    harvested=list(harvested),
-                    meta={},
-                )
+            seeds = by_bucket.get(bucket, [])
+            yield from self._discover_then_eq(
+                base_query, year, bucket, seeds, cfg, disc_by_seed
+            )
 
-                # eq on harvested first
-                seen: set[str] = set()
-                for org in harvested:
-                    if org in seen:
-                        continue
-                    seen.add(org)
-                    cached_eq = self.cache.get_eq(
-                        self.provider_label, year, org
-                    )
-                    if cached_eq is None:
-                        total = self.provider.count_eq(org, year=year)
-                        self.cache.put_eq(
-                            self.provider_label, year, org, total
-                        )
-                    else:
-                        total = cached_eq
-                    if cfg.debug:
-                        print(
-                            f"[eq] y={year or '-'} try={org!r} bucket={bucket} -> total={total}",
-                            flush=True,
-                        )
-                    yield EqAttemptResult(
-                        base_query=base_query,
-                        year=year,
-                        variant=org,
-                        bucket=bucket,
-                        total=total,
-                        meta={},
-                    )
-
-            # now eq each seed that had zero discovery knowledge
-            for seed in seeds:
-                cached_disc = self.cache.get_discovery(
-                    self.provider_label, year, seed
-                )
-                had_none = cached_disc is None or len(cached_disc) == 0
-                if had_none:
-                    cached_eq = self.cache.get_eq(
-                        self.provider_label, year, seed
-                    )
-                    if cached_eq is None:
-                        total = self.provider.count_eq(seed, year=year)
-                        self.cache.put_eq(
-                            self.provider_label, year, seed, total
-                        )
-                    else:
-                        total = cached_eq
-                    if cfg.debug:
-                        print(
-                            f"[eq] y={year or '-'} try={seed!r} bucket={bucket} -> total={total}",
-                            flush=True,
-                        )
-                    yield EqAttemptResult(
-                        base_query=base_query,
-                        year=year,
-                        variant=seed,
-                        bucket=bucket,
-                        total=total,
-                        meta={},
-                    )
+            # now eq each seed that had zero discovery knowledge (an empty
+            # harvest is stored as has_hits=False, i.e. reads back as None)
+            no_disc = [
+                (seed, bucket) for seed in seeds if not disc_by_seed.get(seed)
+            ]
+            yield from self._eq_events(base_query, year, no_disc, cfg)
 
         # Stage B: discovery on expansions
         for bucket in ["expand_legal", "expand_other", "expand_orig"]:
-            seeds = [v for (v, b) in candidates if b == bucket]
-            for seed in seeds:
-                cached_disc = self.cache.get_discovery(
-                    self.provider_label, year, seed
-                )
-                if cached_disc is None:
-                    harvested = self.provider.discover_prefix(
-                        seed, year=year, limit=cfg.discovery_limit
-                    )
-                    self.cache.put_discovery(
-                        self.provider_label, year, seed, harvested
-                    )
-                else:
-                    harvested = cached_disc
-
-                if cfg.debug:
-                    sample = ", ".join(harvested[:3]) if harvested else "-"
-                    print(
-                        f"[discover] y={year or '-'} prefix={seed!r} bucket={bucket} -> harvested={len(harvested)} sample=[{sample}]",
-                        flush=True,
-                    )
-                yield DiscoveryResult(
-                    base_query=base_query,
-                    year=year,
-                    seed=seed,
-                    bucket=bucket,
-                    harvested=list(harvested),
-                    meta={},
-                )
-
-                seen: set[str] = set()
-                for org in harvested:
-                    if org in seen:
-                        continue
-                    seen.add(org)
-                    cached_eq = self.cache.get_eq(
-                        self.provider_label, year, org
-                    )
-                    if cached_eq is None:
-                        total = self.provider.count_eq(org, year=year)
-                        self.cache.put_eq(
-                            self.provider_label, year, org, total
-                        )
-                    else:
-                        total = cached_eq
-                    if cfg.debug:
-                        print(
-                            f"[eq] y={year or '-'} try={org!r} bucket={bucket} -> total={total}",
-                            flush=True,
-                        )
-                    yield EqAttemptResult(
-                        base_query=base_query,
-                        year=year,
-                        variant=org,
-                        bucket=bucket,
-                        total=total,
-                        meta={},
-                    )
+            yield from self._discover_then_eq(
+                base_query, year, bucket, by_bucket.get(bucket, []), cfg
+            )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from .cache import CacheKey, NamePlanCache
@@ -89,9 +90,9 @@ def plan_names(
             k = CacheKey(
                 provider=provider_name, year=year, op="discover", key=seed
             )
-            cached = cache.get(k)
-            if cached is not None:
-                found = ["cached_hit"] if cached.get("has_hits", False) else []
+            hit = cache.get_has_hits(k)
+            if hit is not None:
+                found = ["cached_hit"] if hit else []
             else:
                 try:
                     found = discover_orgs_via_begins(
@@ -119,18 +120,15 @@ def plan_names(
     if probe_opts.run_eq:
         names_to_eq: List[Tuple[str, str]] = []
         for item in variants_sorted:
-            names_to_eq.append((item["name"], item["bucket"]))
-            for d in discovery.get(item["name"], []):
-                names_to_eq.append((d, item["bucket"]))
+            name, bucket = item["name"], item["bucket"]
+            names_to_eq.append((name, bucket))
+            names_to_eq.extend((d, bucket) for d in discovery.get(name, ()))
 
         for name, bucket in names_to_eq:
             k = CacheKey(provider=provider_name, year=year, op="eq", key=name)
-            cached = cache.get(k)
-            if cached is not None:
-                if cached.get("has_hits", False):
-                    cnt, payload = 1, {"cached": True}
-                else:
-                    cnt, payload = 0, {}
+            hit = cache.get_has_hits(k)
+            if hit is not None:
+                cnt, payload = (1, {"cached": True}) if hit else (0, {})
             else:
                 try:
                     cnt, payload = eq_count(
@@ -168,16 +166,8 @@ def plan_names(
 
 
 def _count_by_bucket(items: List[VariantItem]) -> Dict[Bucket, int]:
-    out: Dict[Bucket, int] = {
-        "orig": 0,
-        "gleif_legal": 0,
-        "gleif_other": 0,
-        "gleif_sub": 0,
-        "expand_legal": 0,
-        "expand_other": 0,
-        "expand_orig": 0,
-        "expand_sub": 0,
-    }
-    for it in items:
-        out[it["bucket"]] = out.get(it["bucket"], 0) + 1
+    # every known bucket (zero if unused) in PRINT_ORDER order, then any
+    # unknown ones in first-seen order
+    out: Dict[Bucket, int] = dict.fromkeys(PRINT_ORDER, 0)
+    out.update(Counter(it["bucket"] for it in items))
     return out
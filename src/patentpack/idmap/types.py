@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Dict, List, Literal, Optional, Tuple, TypedDict
 
@@ -54,10 +55,9 @@ class NamePlan:
     def __post_init__(self):
         # auto-populate counts if variants provided; else leave {} (tests expect empty)
         if self.ordered_variants:
-            counts: Dict[Bucket, int] = {}
-            for it in self.ordered_variants:
-                b = it["bucket"]  # type: ignore[index]
-                counts[b] = counts.get(b, 0) + 1
+            counts: Dict[Bucket, int] = dict(
+                Counter(it["bucket"] for it in self.ordered_variants)
+            )
             object.__setattr__(self, "counts_by_bucket", counts)
 
 
@@ -1,9 +1,33 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 
-def _gleif_subsidiaries_for_lei(subs_df, parent_lei: str) -> List[str]:
+def _subs_index(subs_df) -> Dict[str, List[Any]]:
+    """
+    {UPPER(parent_lei): [subsidiary_name, ...]} for one subsidiaries frame.
+
+    Build it once and pass it as `index=` to _gleif_subsidiaries_for_lei
+    when looking up many LEIs in the same frame: the parent column is then
+    uppercased and grouped once instead of masked per call. The index is a
+    snapshot; rebuild it after editing the frame.
+    """
+    if subs_df is None or not hasattr(subs_df, "empty") or subs_df.empty:
+        return {}
+    if "subsidiary_name" not in subs_df.columns:
+        return {}
+    keys = subs_df["parent_lei"].astype(str).str.upper()
+    return (
+        subs_df["subsidiary_name"]
+        .groupby(keys, sort=False)
+        .agg(list)
+        .to_dict()
+    )
+
+
+def _gleif_subsidiaries_for_lei(
+    subs_df, parent_lei: str, index: Optional[Dict[str, List[Any]]] = None
+) -> List[str]:
     # Lazy import so pandas isn't a hard dependency of patentpack
     try:
         import pandas as pd  # type: ignore
@@ -17,65 +41,70 @@ def _gleif_subsidiaries_for_lei(subs_df, parent_lei: str) -> List[str]:
     if not hasattr(subs_df, "empty") or subs_df.empty:
         return []
     key = str(parent_lei).strip().upper()
-    rows = subs_df[subs_df["parent_lei"].astype(str).str.upper() == key]
-    out: List[str] = []
-    seen: set[str] = set()
-    for nm in rows.get("subsidiary_name", []):
-        v = " ".join(str(nm).split()).strip()
-        if v and v not in seen:
-            seen.add(v)
-            out.append(v)
-    return out
+    if index is not None:  # caller-owned _subs_index(subs_df)
+        names = index.get(key, ())
+    else:
+        rows = subs_df[subs_df["parent_lei"].astype(str).str.upper() == key]
+        names = rows.get("subsidiary_name", ())
+    # whitespace-squashed, de-duplicated, first occurrence wins
+    return list(
+        dict.fromkeys(v for nm in names if (v := " ".join(str(nm).split())))
+    )
+
+
+# _score_sub_name substring cues (matched against the lowercased name)
+_DESIGNATOR_CUES = (
+    "gmbh",
+    "inc",
+    "ltd",
+    "llc",
+    "plc",
+    "co.",
+    "co ",
+    "s.a.",
+    "s.p.a",
+    "k.k.",
+    "kabushiki kaisha",
+)
+_OPERATING_CUES = (
+    "manufactur",
+    "technology",
+    "tech",
+    "electronics",
+    "chemical",
+    "materials",
+    "optical",
+    "semiconductor",
+    "software",
+    "systems",
+)
+_HOLDING_CUES = (
+    "holdings",
+    "investment",
+    "capital",
+    "finance",
+    "group",
+    "holdco",
+    "treasury",
+)
+
+
+def _contains_any(n: str, cues: Tuple[str, ...]) -> bool:
+    # plain loop: no generator frame per call, stops at the first hit
+    for t in cues:
+        if t in n:
+            return True
+    return False
 
 
 def _score_sub_name(nm: str, brand_hint: str) -> float:
     n = (nm or "").lower()
     score = 0.0
-    if any(
-        t in n
-        for t in [
-            "gmbh",
-            "inc",
-            "ltd",
-            "llc",
-            "plc",
-            "co.",
-            "co ",
-            "s.a.",
-            "s.p.a",
-            "k.k.",
-            "kabushiki kaisha",
-        ]
-    ):
+    if _contains_any(n, _DESIGNATOR_CUES):
         score += 1.0
-    if any(
-        t in n
-        for t in [
-            "manufactur",
-            "technology",
-            "tech",
-            "electronics",
-            "chemical",
-            "materials",
-            "optical",
-            "semiconductor",
-            "software",
-            "systems",
-        ]
-    ):
+    if _contains_any(n, _OPERATING_CUES):
         score += 0.5
-    if any(
-        t in n
-        for t in [
-            "holdings",
-            "investment",
-            "capital",
-            "finance",
-            "group",
-            "holdco",
-            "treasury",
-        ]
-    ):
+    if _contains_any(n, _HOLDING_CUES):
         score -= 0.75
     if brand_hint and brand_hint.lower() in n:
         score += 0.5
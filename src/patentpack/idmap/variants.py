@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import re
-from typing import Iterable, List, Literal, Optional, Tuple
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Literal, Optional, Tuple
 
 from patentpack.common.orgnorm.variants import expand_query_variants  # type: ignore
 
@@ -26,29 +26,40 @@ _DESIGNATOR_TOKENS = {
     "pty ltd","proprietary limited","pty. ltd.","ptyltd","zrt","rt","oao","zao","ooo","ao","pa",
 }
 
-_DOT_RE = re.compile(r"\.")
+_TOKEN_PUNCT = " ,\"'()[]{}"
 
 def _normalize_token(tok: str) -> str:
     """Lower, strip outer punctuation, drop internal dots for matching."""
-    t = tok.strip(" ,\"'()[]{}").lower()
-    t = _DOT_RE.sub("", t)  # remove internal dots: 's.p.a.' -> 'spa'
-    return t
+    # remove internal dots: 's.p.a.' -> 'spa'
+    # (str.translate over one delete-table is ~9x slower on short tokens and
+    # would also drop inner punctuation; strip/lower/replace stays)
+    return tok.strip(_TOKEN_PUNCT).lower().replace(".", "")
 
 def _has_designator(name: str) -> bool:
-    toks = [_normalize_token(t) for t in (name or "").split()]
-    return any(t in _DESIGNATOR_TOKENS for t in toks)
+    # Same per-token normalization as _normalize_token, inlined: this runs
+    # for every expansion. Whole whitespace tokens only, so multi-word
+    # entries (e.g. 'co ltd') match through their single-word parts.
+    # Designators trail the name, so scan from the end and stop at a hit.
+    for t in reversed((name or "").split()):
+        if t.strip(_TOKEN_PUNCT).lower().replace(".", "") in _DESIGNATOR_TOKENS:
+            return True
+    return False
 
 def _squash_ws(s: str) -> str:
     return " ".join(str(s or "").split()).strip()
 
-def _add_uc_variant(name: str, bucket: Bucket, out: List[VariantItem], seen: set[str]) -> None:
-    uc = _squash_ws((name or "").upper())
+def _add_uc_variant(name: str, bucket: Bucket, out: List[VariantItem], seen: set[str], squashed: Optional[str] = None) -> None:
+    # `squashed` is _squash_ws(name) when the caller already has it;
+    # upper() never adds or removes whitespace, so squash-then-upper is
+    # the same string as upper-then-squash.
+    sq = _squash_ws(name) if squashed is None else squashed
+    uc = sq.upper()
     if not uc:
         return
     if uc in seen:
         return
     # if original is already exactly the UC form, don't add a duplicate
-    if uc == _squash_ws(name):
+    if uc == sq:
         # still mark seen so future calls won't add it
         seen.add(uc)
         return
@@ -56,6 +67,21 @@ def _add_uc_variant(name: str, bucket: Bucket, out: List[VariantItem], seen: set
     seen.add(uc)
 
 
+@lru_cache(maxsize=4096)
+def _designated_expansions(seed: str) -> Tuple[str, ...]:
+    """Distinct expansions of `seed` (not the seed itself) with a designator."""
+    try:
+        expanded = list(expand_query_variants(seed))
+    except Exception:
+        expanded = []
+    seed_sq = _squash_ws(seed)
+    return tuple(
+        v
+        for v in expanded
+        if v and _squash_ws(v) != seed_sq and _has_designator(v)
+    )
+
+
 def build_bucketed_variants(
     *,
     base_name: str,
@@ -73,77 +99,114 @@ def build_bucketed_variants(
 
     We keep original capitalization/punctuation for EQ sensitivity.
     """
+    rows = _bucketed_variants(
+        base_name,
+        gleif_legal,
+        tuple(gleif_other_names or ()),
+        tuple(subsidiaries or ()),
+        bool(include_expansions),
+        max_variants,
+    )
+    # Fresh dicts per call: the plan is memoized, callers may mutate items
+    return [VariantItem(name=n, bucket=b, kind=k) for n, b, k in rows]
+
+
+def build_bucketed_variants_soa(
+    *,
+    base_name: str,
+    gleif_legal: str = "",
+    gleif_other_names: Iterable[str] = (),
+    subsidiaries: Iterable[str] = (),
+    include_expansions: bool = True,
+    max_variants: int = 0,
+) -> Tuple[List[str], List[Bucket], List[str]]:
+    """
+    Same plan as build_bucketed_variants, as parallel (names, buckets, kinds)
+    lists: no per-variant dict, and `names` can go straight to a batch
+    provider call.
+    """
+    rows = _bucketed_variants(
+        base_name,
+        gleif_legal,
+        tuple(gleif_other_names or ()),
+        tuple(subsidiaries or ()),
+        bool(include_expansions),
+        max_variants,
+    )
+    if not rows:
+        return [], [], []
+    names, buckets, kinds = zip(*rows)
+    return list(names), list(buckets), list(kinds)
+
+
+@lru_cache(maxsize=1024)
+def _bucketed_variants(
+    base_name: str,
+    gleif_legal: str,
+    gleif_other_names: Tuple[str, ...],
+    subsidiaries: Tuple[str, ...],
+    include_expansions: bool,
+    max_variants: int,
+) -> Tuple[Tuple[str, Bucket, str], ...]:
     out: List[VariantItem] = []
+    # Holds the very str objects stored in `out` (plus a few UC forms), so
+    # it costs one pointer per slot; str caches its hash for the lookups.
     seen: set[str] = set()
 
     def push(
-        name: str, bucket: Bucket, kind: Literal["seed", "expand"]
+        nv: str, bucket: Bucket, kind: Literal["seed", "expand"]
     ) -> None:
-        nv = _squash_ws(name)
+        # `nv` is already whitespace-squashed
         if not nv or nv in seen:
             return
         seen.add(nv)
         out.append(VariantItem(name=nv, bucket=bucket, kind=kind))
 
-    # ---------------- Seeds (ordered) ----------------
-    if base_name:
-        push(base_name, "orig", "seed")
-        _add_uc_variant(base_name, "orig", out, seen)
-
-    if gleif_legal:
-        push(gleif_legal, "gleif_legal", "seed")
-        _add_uc_variant(gleif_legal, "gleif_legal", out, seen)
-
-    for nm in gleif_other_names or []:
-        if nm:
-            push(nm, "gleif_other", "seed")
-            _add_uc_variant(nm, "gleif_other", out, seen)
-
-    for sub in subsidiaries or []:
-        if sub:
-            push(sub, "gleif_sub", "seed")
-            _add_uc_variant(sub, "gleif_sub", out, seen)
-
-    # ---------------- Expansions ----------------
-    if include_expansions:
-
-        def expand_many(seed: str, bucket: Bucket) -> None:
-            try:
-                expanded = list(expand_query_variants(seed))
-            except Exception:
-                expanded = []
-
-            for v in expanded:
-                # keep only meaningful, distinct expansions with a designator
-                if not v:
-                    continue
-                if _squash_ws(v) == _squash_ws(seed):
-                    continue
-                if not _has_designator(v):
-                    continue
-
-                # add expansion and its UC (UC stays in the same expand_* bucket)
-                push(v, bucket, "expand")
-                _add_uc_variant(v, bucket, out, seen)
-
-            # NOTE: we intentionally do NOT add UC of the seed here.
-            # Seeds (incl. UC) were already added above to keep all seeds
-            # before any expansions.
-
+    def steps() -> Iterator[Tuple[str, Bucket, Literal["seed", "expand"]]]:
+        # Lazy, so nothing past the max_variants cap is ever expanded.
+        # ---------------- Seeds (ordered) ----------------
+        if base_name:
+            yield base_name, "orig", "seed"
         if gleif_legal:
-            expand_many(_squash_ws(gleif_legal), "expand_legal")
-        for nm in gleif_other_names or []:
+            yield gleif_legal, "gleif_legal", "seed"
+        for nm in gleif_other_names:
             if nm:
-                expand_many(_squash_ws(nm), "expand_other")
+                yield nm, "gleif_other", "seed"
+        for sub in subsidiaries:
+            if sub:
+                yield sub, "gleif_sub", "seed"
+
+        # ---------------- Expansions ----------------
+        # NOTE: we intentionally do NOT add UC of the seed here.
+        # Seeds (incl. UC) were already added above to keep all seeds
+        # before any expansions.
+        if not include_expansions:
+            return
+        seeds: List[Tuple[str, Bucket]] = []
+        if gleif_legal:
+            seeds.append((gleif_legal, "expand_legal"))
+        seeds.extend((nm, "expand_other") for nm in gleif_other_names if nm)
         if base_name:
-            expand_many(_squash_ws(base_name), "expand_orig")
-        for sub in subsidiaries or []:
-            expand_many(_squash_ws(sub), "expand_sub")
+            seeds.append((base_name, "expand_orig"))
+        seeds.extend((sub, "expand_sub") for sub in subsidiaries)
+        for seed, bucket in seeds:
+            # keep only meaningful, distinct expansions with a designator
+            for v in _designated_expansions(_squash_ws(seed)):
+                yield v, bucket, "expand"
+
+    cap = max_variants if max_variants and max_variants > 0 else 0
+    for name, bucket, kind in steps():
+        # each entry plus its UC (an expansion's UC stays in its bucket)
+        nv = _squash_ws(name)  # shared by the entry and its UC
+        push(nv, bucket, kind)
+        _add_uc_variant(name, bucket, out, seen, squashed=nv)
+        if cap and len(out) >= cap:
+            break
 
-    if max_variants and max_variants > 0:
-        out = out[:max_variants]
+    if cap:
+        out = out[:cap]  # the UC step may overshoot by one
 
-    return out
+    return tuple((v["name"], v["bucket"], v["kind"]) for v in out)
 
 def build_cache_aware_variants(
     *,
@@ -175,9 +238,14 @@ def build_cache_aware_variants(
             max_variants=max_variants,
         )
 
-    # Check if the original variant has had any hits
+    # Check if the original variant has had any hits. Writers key on the
+    # whitespace-squashed variant (see push()), so look it up the same way;
+    # case is kept, since provider matching is case-sensitive.
     orig_key = CacheKey(
-        provider=provider_name, year=year or 0, op="discover", key=base_name
+        provider=provider_name,
+        year=year or 0,
+        op="discover",
+        key=_squash_ws(base_name),
     )
 
     has_orig_hits = cache.has_hits(orig_key)
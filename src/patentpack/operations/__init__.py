@@ -1,4 +1,5 @@
 # src/patentpack/operations/__init__.py
+from .cache import VectorCache
 from .cpc_vectors import CPCVectorResult, cpc_class_vector
 
-__all__ = ["cpc_class_vector", "CPCVectorResult"]
+__all__ = ["cpc_class_vector", "CPCVectorResult", "VectorCache"]
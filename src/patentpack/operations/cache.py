@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from ..config import CACHE_DIR
+
+# Persistent cache of cpc_class_vector bins (prefix -> count).
+# Key:   provider | level | fingerprint of the ordered prefix list
+#        | company | year | which | utility_only
+# Value: the full bins dict (zeros included), stored as JSON text with a
+#        timestamp; entries are served for `ttl_s` (default 30d).
+# A warm run is one row read instead of one provider call per prefix.
+
+_DEFAULT_PATH = Path(CACHE_DIR) / "cpc_vectors.sqlite"
+DEFAULT_TTL_S = 30 * 86400
+
+
+def vector_key(
+    *,
+    provider: str,
+    level: str,
+    prefixes: Iterable[str],
+    company: str,
+    year: int,
+    which: Optional[str] = None,
+    utility_only: bool = False,
+) -> str:
+    # The prefix list can run to thousands of groups: fingerprint it.
+    fp = hashlib.blake2b(
+        "\n".join(prefixes).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return json.dumps(
+        [provider, level, fp, company, int(year), which, bool(utility_only)],
+        ensure_ascii=False,
+    )
+
+
+class VectorCache:
+    def __init__(
+        self, path: Optional[Path] = None, ttl_s: float = DEFAULT_TTL_S
+    ) -> None:
+        self.path = path or _DEFAULT_PATH
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS vectors ("
+                "key TEXT PRIMARY KEY, ts REAL NOT NULL, bins TEXT NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, int]]:
+        with self._lock:
+            row = (
+                self._db()
+                .execute("SELECT ts, bins FROM vectors WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None or time.time() - row[0] > self.ttl_s:
+            return None
+        try:
+            return json.loads(row[1])
+        except ValueError:
+            return None
+
+    def put(self, key: str, bins: Dict[str, int]) -> None:
+        rec = (key, time.time(), json.dumps(bins))
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO vectors (key, ts, bins) "
+                "VALUES (?, ?, ?)",
+                rec,
+            )
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
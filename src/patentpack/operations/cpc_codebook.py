@@ -17,12 +17,28 @@ endpoints once per level and writes results into JSON caches under
 """
 
 import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Literal, Optional, Tuple
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
 import requests
-
-from ..config import CACHE_DIR, PATENTSEARCHKEY
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import (
+    CACHE_DIR,
+    DEFAULT_RPM,
+    PATENTSEARCHKEY,
+    RETRY_ALLOWED_METHODS,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_JITTER,
+    RETRY_STATUS_FORCELIST,
+)
 
 Level = Literal["section", "class", "subclass", "group"]
 
@@ -33,12 +49,71 @@ _ENDPOINTS = {
     "subclass": ("cpc_subclass", "cpc_subclasses", "cpc_subclass_id"),
     "group": ("cpc_group", "cpc_groups", "cpc_group_id"),
 }
+# Concurrent per-subclass requests in the group sweep. Every call is paced
+# by _pv_pace (the classification endpoints share the API key's rate
+# limit), so more workers only overlap latency, not exceed the rate.
+_GROUP_SWEEP_WORKERS = 2
+
+# Shared spacing of classification calls across threads: one request per
+# 60/DEFAULT_RPM seconds (40/min by default, under PatentSearch's 45).
+_PV_PACE_LOCK = threading.Lock()
+_pv_next_at = 0.0
+
+
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# mkstemp creates 0600 files; cache files get the mode a plain open() would
+# (read once at import: os.umask can only be read by setting it)
+_CACHE_FILE_MODE = 0o666 & ~_read_umask()
 
 
 def _cache_path(level: Level) -> Path:
     return CACHE_DIR / f"codebook_{level}.json"
 
 
+@lru_cache(maxsize=8)
+def _read_codebook(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    # keyed on mtime too: a rebuilt or replaced cache file is re-read
+    return tuple(json.loads(Path(path).read_bytes()))
+
+
+@lru_cache(maxsize=1)
+def _pv_session() -> requests.Session:
+    # One pooled session for all classification calls: keeps connections
+    # (and TLS) alive across pages/subclasses; one per sweep worker.
+    # Transient 429/5xx back off inside urllib3 (same policy as the
+    # providers; Retry-After is honored).
+    retry = Retry(
+        total=6,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=_GROUP_SWEEP_WORKERS)
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def _pv_pace() -> None:
+    global _pv_next_at
+    # Serialized so concurrent sweep workers take turns; the request
+    # itself runs outside the lock.
+    with _PV_PACE_LOCK:
+        now = time.monotonic()
+        if _pv_next_at > now:
+            time.sleep(_pv_next_at - now)
+            now = _pv_next_at
+        _pv_next_at = now + 60.0 / max(1, DEFAULT_RPM)
+
+
 def _pv_headers() -> dict:
     h = {"Accept": "application/json", "Content-Type": "application/json"}
     if PATENTSEARCHKEY:
@@ -56,20 +131,28 @@ def _pv_post(
     """
     url = f"{_PV_BASE}/{path.strip('/')}/"
     payload = {"q": (q or {}), "o": {"page": page, "size": size}}
-    r = requests.post(url, headers=_pv_headers(), json=payload, timeout=30)
+    _pv_pace()
+    r = _pv_session().post(
+        url, headers=_pv_headers(), json=payload, timeout=30
+    )
     r.raise_for_status()
     return r.json()
 
 
-def _pv_collect_ids(path: str, list_key: str, id_key: str) -> List[str]:
+def _pv_collect_ids(
+    path: str, list_key: str, id_key: str, *, dedup: bool = False
+) -> List[str]:
     """
     Generic collector for endpoints that actually paginate correctly.
-    Used for 'class' and 'subclass'.
+    Used for 'class' and 'subclass', whose pages carry unique ids; pass
+    `dedup=True` for an endpoint that may repeat ids across pages.
     """
     size = 1000
     page = 1
-    seen: List[str] = []
-    seen_set = set()  # for progress sanity / de-dupe detection
+    out: List[str] = []
+    # dedup=True only: insertion-ordered de-dupe in one container
+    uniq: Dict[str, None] = {}
+    prev: List[str] = []
 
     print(f"[codebook] {path} pagination start")
     while True:
@@ -84,15 +167,22 @@ def _pv_collect_ids(path: str, list_key: str, id_key: str) -> List[str]:
             print(f"[codebook] {path} page {page} • got=0 • stopping")
             break
 
-        # progress & uniqueness
-        before = len(seen_set)
-        for v in ids:
-            if v and v not in seen_set:
-                seen_set.add(v)
-                seen.append(v)
-        after = len(seen_set)
+        # progress & (provider-side pagination bug) repeated-page detection
+        if dedup:
+            before = len(uniq)
+            uniq.update(dict.fromkeys(v for v in ids if v))
+            total = len(uniq)
+            stalled = total == before
+        else:
+            # a repeated page is equal to the previous one; comparing the
+            # lists stops at the first differing id on a healthy page
+            stalled = ids == prev
+            if not stalled:
+                out.extend(v for v in ids if v)
+            total = len(out)
+        prev = ids
         print(
-            f"[codebook] {path} page {page} • got={len(ids)} • unique_total={after}"
+            f"[codebook] {path} page {page} • got={len(ids)} • total={total}"
         )
 
         # stop conditions
@@ -101,8 +191,7 @@ def _pv_collect_ids(path: str, list_key: str, id_key: str) -> List[str]:
                 f"[codebook] {path} page {page} • short page ({len(ids)}<{size}) • stopping"
             )
             break
-        if after == before:
-            # page repeated same content (provider-side pagination bug)
+        if stalled:
             print(f"[codebook] {path} page {page} • no new ids • stopping")
             break
 
@@ -111,7 +200,7 @@ def _pv_collect_ids(path: str, list_key: str, id_key: str) -> List[str]:
             print(f"[codebook] {path} page limit hit (200) • stopping")
             break
 
-    return seen
+    return list(uniq) if dedup else out
 
 
 def _collect_groups_via_subclasses(
@@ -122,17 +211,15 @@ def _collect_groups_via_subclasses(
       POST /cpc_group/ with q={'cpc_subclass_id': <subclass>} and o={'size': 1000}
     This avoids broken multi-page behavior observed when trying to paginate cpc_group directly.
     """
-    # Build/get the subclass codebook first
-    from .cpc_codebook import (  # local import to avoid circulars at import time
-        get_codebook,
-    )
-
+    # Build/get the subclass codebook first (get_codebook is defined below
+    # in this module; it is only looked up at call time)
     subclass_codes, meta = get_codebook("subclass")
     if roots:
-        roots_u = [str(r).strip().upper() for r in roots if str(r).strip()]
-        subclass_codes = [
-            s for s in subclass_codes if any(s.startswith(r) for r in roots_u)
-        ]
+        # tuple: str.startswith tests all roots in one C-level call
+        roots_u = tuple(
+            str(r).strip().upper() for r in roots if str(r).strip()
+        )
+        subclass_codes = [s for s in subclass_codes if s.startswith(roots_u)]
 
     print(
         f"[codebook] group via subclasses • subclasses={len(subclass_codes)} (filtered)"
@@ -141,30 +228,41 @@ def _collect_groups_via_subclasses(
     seen_set = set()
     seen: List[str] = []
 
-    for idx, sc in enumerate(subclass_codes, start=1):
-        data = _pv_post(
+    def fetch(sc: str) -> dict:
+        return _pv_post(
             "cpc_group", page=1, size=size, q={"cpc_subclass_id": sc}
         )
-        rows = data.get("cpc_groups") or []
-        ids = [
-            (row.get("cpc_group_id") or "").strip().upper()
-            for row in rows
-            if row.get("cpc_group_id")
-        ]
-
-        before = len(seen_set)
-        for v in ids:
-            if v and v not in seen_set:
-                seen_set.add(v)
-                seen.append(v)
-        after = len(seen_set)
 
-        # periodic progress
-        added = after - before
-        if added > 0 or (idx % 25 == 0):
-            print(
-                f"[codebook] group @{sc} ({idx}/{len(subclass_codes)}) • +{added} → groups={after}"
-            )
+    # Requests overlap on the pool; responses are consumed in subclass
+    # order on this thread, so aggregation and progress output match the
+    # sequential sweep.
+    pool = ThreadPoolExecutor(max_workers=_GROUP_SWEEP_WORKERS)
+    try:
+        pages = pool.map(fetch, subclass_codes)
+        for idx, (sc, data) in enumerate(zip(subclass_codes, pages), start=1):
+            rows = data.get("cpc_groups") or []
+            ids = [
+                (row.get("cpc_group_id") or "").strip().upper()
+                for row in rows
+                if row.get("cpc_group_id")
+            ]
+
+            before = len(seen_set)
+            for v in ids:
+                if v and v not in seen_set:
+                    seen_set.add(v)
+                    seen.append(v)
+            after = len(seen_set)
+
+            # periodic progress
+            added = after - before
+            if added > 0 or (idx % 25 == 0):
+                print(
+                    f"[codebook] group @{sc} ({idx}/{len(subclass_codes)}) • +{added} → groups={after}"
+                )
+    finally:
+        # on error, don't sit through every queued subclass request
+        pool.shutdown(cancel_futures=True)
 
     return seen
 
@@ -206,7 +304,8 @@ def get_codebook(
     """
     cache = _cache_path(level)
     if cache.exists():
-        codes = json.loads(cache.read_text())
+        # parsed once per file version; the list is the caller's to keep
+        codes = list(_read_codebook(str(cache), cache.stat().st_mtime_ns))
         meta = {
             "source": "cache",
             "path": str(cache),
@@ -226,7 +325,20 @@ def get_codebook(
             }
         )
         cache.parent.mkdir(parents=True, exist_ok=True)
-        cache.write_text(json.dumps(codes, ensure_ascii=False))
+        # write-then-rename: a crash mid-write never leaves a truncated
+        # cache behind (which would force a full re-fetch next run)
+        # (unique temp name: concurrent builders never share a temp file)
+        fd, tmp = tempfile.mkstemp(
+            dir=cache.parent, prefix=cache.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(json.dumps(codes, ensure_ascii=False))
+            os.chmod(tmp, _CACHE_FILE_MODE)
+            os.replace(tmp, cache)
+        except BaseException:
+            os.unlink(tmp)
+            raise
         meta = {
             "source": src,
             "path": str(cache),
@@ -236,7 +348,9 @@ def get_codebook(
         print(f"[codebook] wrote cache: {cache} ({len(codes)} codes)")
 
     if roots:
-        roots_u = [str(r).strip().upper() for r in roots if str(r).strip()]
-        codes = [c for c in codes if any(c.startswith(r) for r in roots_u)]
+        roots_u = tuple(
+            str(r).strip().upper() for r in roots if str(r).strip()
+        )
+        codes = [c for c in codes if c.startswith(roots_u)]
 
     return codes, meta
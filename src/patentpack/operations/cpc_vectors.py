@@ -19,18 +19,30 @@ by CPC section/class/subclass/group:
 - Caveats: Group-level vectors can be prohibitively large in practice; most
   workflows should restrict runs to section/class/subclass.
 
+- Fan-out: Providers exposing `count_by_cpc_company_year_batch` get every
+  prefix in one call; otherwise per-prefix counts run one at a time, or on
+  an opt-in thread pool (`max_workers` > 1) that relies on the provider's
+  own pacing for its RPM.
+- Caching: an optional `VectorCache` (sqlite under CACHE_DIR) persists
+  finished vectors, so repeated company-year runs skip the sweep.
+
 This layer provides the vectors used in downstream hierarchical searches,
-but does not attempt assignee disambiguation, concurrency management, or
-rate-limit enforcement.
+but does not attempt assignee disambiguation or rate-limit enforcement.
 """
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from ..core.contracts import CountResult
 from ..core.interfaces import PatentProvider, Which
+from .cache import VectorCache, vector_key
 from .cpc_codebook import Level, get_codebook
 
+# subclass + first two group digits, e.g. 'Y02C20/00' -> ('Y02C', '20')
+_GROUP_RE = re.compile(r"^([A-HY]\d{2}[A-Z])\s*(\d{2})")
+
 
 @dataclass(frozen=True)
 class CPCVectorResult:
@@ -42,11 +54,8 @@ class CPCVectorResult:
 
 
 def _norm_codes(codes: Iterable[str]) -> List[str]:
-    return [
-        str(c).strip().upper().replace(" ", "")
-        for c in codes
-        if str(c).strip()
-    ]
+    # str()/strip() once per code; the stripped form is also the filter
+    return [n.upper().replace(" ", "") for c in codes if (n := str(c).strip())]
 
 
 def _prefix_for_level(code: str, level: Level) -> str:
@@ -69,14 +78,71 @@ def _prefix_for_level(code: str, level: Level) -> str:
     if level == "subclass":
         return code[:4] if len(code) >= 4 else code
     if level == "group":
-        import re
-
         # Accept 'Y02C20/00' or 'Y02C 20/00' -> 'Y02C20'
-        m = re.match(r"^([A-HY]\d{2}[A-Z])\s*(\d{2})", code)
+        m = _GROUP_RE.match(code)
         return (m.group(1) + m.group(2)) if m else code
     return code
 
 
+def _count_prefixes(
+    provider: PatentProvider,
+    unique: List[str],
+    kwargs: Dict,
+    *,
+    label: str,
+    level: str,
+    verbose: bool,
+    log_every: int,
+    max_workers: int,
+) -> Tuple[Dict[str, int], int]:
+    """
+    One count per distinct prefix (batch, pooled, or sequential).
+
+    Returns the bins and how many of them are fallback zeros (a
+    CountResult with meta['fallback']: the provider had no usable total).
+    """
+
+    def _count(pref: str) -> CountResult:
+        return provider.count_by_cpc_company_year(cpc=pref, **kwargs)  # type: ignore[arg-type]
+
+    batch = getattr(provider, "count_by_cpc_company_year_batch", None)
+    pool: Optional[ThreadPoolExecutor] = None
+    results: Iterable[CountResult]
+    if batch is not None and unique:
+        got = batch(cpcs=unique, **kwargs)
+        missing = CountResult(total=0, meta={"fallback": True})
+        results = (got.get(p) or missing for p in unique)
+    elif max_workers > 1 and len(unique) > 1:
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(unique)))
+        results = pool.map(_count, unique)  # yields in prefix order
+    else:
+        results = map(_count, unique)
+
+    out: Dict[str, int] = {}
+    fallbacks = 0
+    total = len(unique)
+    try:
+        for i, (pref, res) in enumerate(zip(unique, results), start=1):
+            cnt = int(res.total or 0)
+            out[pref] = cnt
+            if res.meta and res.meta.get("fallback"):
+                fallbacks += 1
+
+            if verbose and (
+                i == 1 or i % max(1, int(log_every)) == 0 or i == total
+            ):
+                print(
+                    f"[cpc_vector] {i:>4}/{total:<4} | "
+                    f"{label} | "
+                    f"{level:<8}={pref:<8} | "
+                    f"count={cnt:>6}"
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return out, fallbacks
+
+
 def cpc_class_vector(
     provider: PatentProvider,
     *,
@@ -90,6 +156,8 @@ def cpc_class_vector(
     keep_zeros: bool = True,
     verbose: bool = False,
     log_every: int = 25,
+    max_workers: int = 1,
+    cache: Optional[VectorCache] = None,
 ) -> CPCVectorResult:
     """
     Provider-agnostic CPC count vector for a single company-year.
@@ -103,6 +171,18 @@ def cpc_class_vector(
     Notes:
       - No name disambiguation here; pass exactly what your provider expects.
       - Group level codebook can be very large; consider roots=['Y02', ...].
+      - Each distinct prefix is counted once. A provider method
+        `count_by_cpc_company_year_batch(*, year, cpcs, company, which,
+        utility_only) -> Mapping[str, CountResult]` is used when present;
+        otherwise up to `max_workers` single counts are in flight at once
+        (1 = sequential, the default). Keep it within the provider's
+        connection pool (10 for USPTO, 8 for EPO) or connections churn.
+      - With a `cache`, the bins are stored per (provider, level, prefix
+        set, company, year, which, utility_only) and a warm run makes no
+        provider calls; meta['cache'] records 'hit' or 'miss'. A vector
+        with fallback zeros (CountResult.meta['fallback'], e.g. an EPO
+        fault body) is not stored: meta['cache'] is then 'skip' and
+        meta['fallback_counts'] says how many bins were affected.
     """
     lvl: str = str(level).strip().lower()
     if lvl not in ("section", "class", "subclass", "group"):
@@ -119,28 +199,50 @@ def cpc_class_vector(
     # Normalize → level-specific prefixes
     prefixes = [_prefix_for_level(c, lvl) for c in _norm_codes(codes)]
 
-    out: Dict[str, int] = {}
-    total = len(prefixes)
-    for i, pref in enumerate(prefixes, start=1):
-        kwargs = dict(year=year, company=company, cpc=pref)
-        if which is not None:
-            kwargs["which"] = which
-        if utility_only:
-            kwargs["utility_only"] = True
-
-        res: CountResult = provider.count_by_cpc_company_year(**kwargs)  # type: ignore[arg-type]
-        cnt = int(res.total or 0)
-        out[pref] = cnt
-
-        if verbose and (
-            i == 1 or i % max(1, int(log_every)) == 0 or i == total
-        ):
+    kwargs: Dict = dict(year=year, company=company)
+    if which is not None:
+        kwargs["which"] = which
+    if utility_only:
+        kwargs["utility_only"] = True
+
+    unique = list(dict.fromkeys(prefixes))  # coarse levels repeat a lot
+    ckey = ""
+    out: Optional[Dict[str, int]] = None
+    if cache is not None:
+        ckey = vector_key(
+            provider=type(provider).__name__,
+            level=lvl,
+            prefixes=unique,
+            company=company,
+            year=year,
+            which=which,
+            utility_only=utility_only,
+        )
+        out = cache.get(ckey)
+        meta["cache"] = "hit" if out is not None else "miss"
+        if out is not None and verbose:
             print(
-                f"[cpc_vector] {i:>4}/{total:<4} | "
-                f"{company:<40} {year} | "
-                f"{level:<8}={pref:<8} | "
-                f"count={cnt:>6}"
+                f"[cpc_vector] cache hit | {company:<40} {year} | "
+                f"{level:<8} | {len(out)} bins"
             )
+    if out is None:
+        out, fallbacks = _count_prefixes(
+            provider,
+            unique,
+            kwargs,
+            label=f"{company:<40} {year}",
+            level=level,
+            verbose=verbose,
+            log_every=log_every,
+            max_workers=max_workers,
+        )
+        if fallbacks:
+            # a transient provider error must not be frozen in for the TTL
+            meta["fallback_counts"] = fallbacks
+            if cache is not None:
+                meta["cache"] = "skip"
+        elif cache is not None:
+            cache.put(ckey, out)
 
     if not keep_zeros:
         out = {k: v for k, v in out.items() if v}
@@ -5,5 +5,5 @@ Each provider module implements the PatentProvider Protocol:
 - UsptoProvider  (PatentsView-compatible API)
 - EpoProvider    (EPO OPS)
 
-Add new providers by creating a module and wiring it in factory.make_provider().
+Add new providers by creating a module and registering it in factory._REGISTRY.
 """
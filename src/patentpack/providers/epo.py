@@ -1,24 +1,45 @@
 from __future__ import annotations
 
 import json
+import re
 import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
-from typing import Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from ..config import (
     DEFAULT_RPM,
     DEFAULT_TIMEOUT_S,
     OPS_AUTH_URL,
     OPS_SEARCH_URL,
+    RETRY_ALLOWED_METHODS,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_JITTER,
+    RETRY_STATUS_FORCELIST,
     epo_key,
     epo_secret,
 )
 from ..core.contracts import AssigneeList, CountResult
 from ..core.interfaces import PatentProvider
+from .pacing import TokenBucket
+
+# Per-instance LRU of count totals by query: a count for fixed filters is
+# stable within a run, and panels ask for the same ones repeatedly.
+_COUNT_CACHE_SIZE = 4096
+
+# OAuth tokens shared by every provider instance with the same credentials,
+# so constructing providers per query/thread does not redo the handshake.
+# (key, secret) -> (access_token, expiry epoch seconds)
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
 
 
 def _extract_total_from_json(data: Dict) -> Optional[int]:
@@ -32,19 +53,60 @@ def _extract_total_from_json(data: Dict) -> Optional[int]:
         return None
 
 
+# Static part of every search request (Authorization is added per token).
+# Accept-Encoding is left to requests, which already asks for gzip/deflate.
+_SEARCH_HEADERS: Dict[str, str] = {
+    "Accept": "application/json",
+    "X-OPS-Range": "1-1",  # only need total
+}
+
+_BIBLIO_SEARCH_TAG = "{http://ops.epo.org}biblio-search"
+# The total sits on the header element a few hundred bytes in; feeding the
+# body in slices lets the parse stop there instead of building the tree of
+# every publication reference that follows.
+_XML_FEED_CHUNK = 1024
+_TOTAL_ATTR_RE = re.compile(r"""\btotal-result-count\s*=\s*["'](\d+)["']""")
+
+
 def _extract_total_from_xml(xml_text: str) -> Optional[int]:
+    # Only ops:biblio-search carries total-result-count in OPS responses, so
+    # one scan for the attribute does the job; the parser below is the
+    # fallback when it finds no match.
+    m = _TOTAL_ATTR_RE.search(xml_text)
+    if m is not None:
+        return int(m.group(1))
     try:
-        ns = {"ops": "http://ops.epo.org"}
-        root = ET.fromstring(xml_text)
-        node = root.find(".//ops:biblio-search", ns)
-        if node is None:
-            return None
-        val = node.attrib.get("total-result-count")
-        return int(val) if val is not None else None
+        parser = ET.XMLPullParser(events=("start",))
+        is_root = True  # like root.find(".//..."): descendants only
+        for i in range(0, len(xml_text), _XML_FEED_CHUNK):
+            j = i + _XML_FEED_CHUNK
+            parser.feed(xml_text[i:j])
+            for _, node in parser.read_events():
+                if is_root:
+                    is_root = False
+                elif node.tag == _BIBLIO_SEARCH_TAG:
+                    val = node.attrib.get("total-result-count")
+                    return int(val) if val is not None else None
+        parser.close()  # raises on an empty/truncated document
+        return None
     except Exception:
         return None
 
 
+def _count_result(total: Optional[int]) -> CountResult:
+    # No usable total (fault/unknown body): report 0, flagged so callers
+    # that persist counts (e.g. VectorCache) can skip it.
+    if total is None:
+        return CountResult(total=0, meta={"fallback": True})
+    return CountResult(total=total)
+
+
+def _looks_like_xml(text: str) -> bool:
+    # first non-blank character (past a BOM) opens a tag
+    return text[:256].lstrip("\ufeff \t\r\n").startswith("<")
+
+
+@lru_cache(maxsize=256)  # a panel revisits the same few years
 def _ymd_bounds(year: int) -> tuple[str, str]:
     return f"{year:04d}0101", f"{year:04d}1231"
 
@@ -59,6 +121,27 @@ def _q_company_year_cpc(company: str, year: int, cpc_prefix: str) -> str:
     return f'applicant="{company}" and cpc=/low {cpc_prefix} and pd within "{start} {end}"'
 
 
+@lru_cache(maxsize=None)
+def _get_session(key: str, secret: str) -> requests.Session:
+    # One pooled session per credential pair, shared by every provider
+    # instance so auth and search calls reuse warm keep-alive connections.
+    # Transient 429/5xx back off inside urllib3 (same policy as USPTO).
+    session = requests.Session()
+    retry = Retry(
+        total=6,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    # auth + search share ops.epo.org; room for concurrent callers
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class EpoProvider(PatentProvider):
     """
     EPO OPS implementation with lightweight debug.
@@ -74,35 +157,62 @@ class EpoProvider(PatentProvider):
     ) -> None:
         self._key = key or epo_key(required=True)
         self._secret = secret or epo_secret(required=True)
-        self._session = requests.Session()
+        self._session = _get_session(self._key, self._secret)
         self._timeout = DEFAULT_TIMEOUT_S
         self._token: Optional[str] = None
+        self._search_headers: Tuple[str, Dict[str, str]] = ("", {})
         self._token_exp: float = 0.0
         self._debug = bool(debug)
+        self._bucket = TokenBucket(rpm)
         self._set_rpm(rpm)
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self._counts_lock = threading.Lock()
 
     # pacing -------------------------------------------------------------
     def _set_rpm(self, rpm: int) -> None:
-        rpm = max(1, int(rpm))
-        self._min_interval = 60.0 / rpm
-        self._last_ts = 0.0
+        # No burst (capacity 1): an even 60/rpm spacing. OPS applies its
+        # own fair-use throttling, unrelated to PatentSearch's quota.
+        self._bucket.set_rpm(rpm)
 
     def set_rpm(self, rpm: int) -> None:
         self._set_rpm(rpm)
 
     def _pace(self) -> None:
-        now = time.monotonic()
-        wait = self._min_interval - (now - self._last_ts)
-        if wait > 0:
-            time.sleep(wait)
-        self._last_ts = time.monotonic()
+        self._bucket.acquire()
+
+    # count memo ---------------------------------------------------------
+    def _cached_count(self, key: str) -> Optional[int]:
+        with self._counts_lock:
+            total = self._counts.get(key)
+            if total is not None:
+                self._counts.move_to_end(key)
+            return total
+
+    def _remember_count(self, key: str, total: int) -> None:
+        with self._counts_lock:
+            self._counts[key] = total
+            if len(self._counts) > _COUNT_CACHE_SIZE:
+                self._counts.popitem(last=False)  # least recently used
 
     # auth ---------------------------------------------------------------
     def _get_token(self) -> str:
         # Reuse token if still valid
         if self._token and (time.time() + 60) < self._token_exp:
             return self._token
-        r = requests.post(
+        creds = (self._key, self._secret)
+        # Held across the refresh: concurrent callers wait for one OAuth
+        # round-trip and then share its token.
+        with _TOKEN_LOCK:
+            hit = _TOKEN_CACHE.get(creds)
+            if hit is None or (time.time() + 60) >= hit[1]:
+                hit = self._fetch_token()
+                _TOKEN_CACHE[creds] = hit
+        self._token, self._token_exp = hit
+        return self._token
+
+    def _fetch_token(self) -> Tuple[str, float]:
+        # same keep-alive pool as searches (one host): no fresh TLS handshake
+        r = self._session.post(
             OPS_AUTH_URL,
             data={"grant_type": "client_credentials"},
             auth=HTTPBasicAuth(self._key, self._secret),
@@ -117,19 +227,18 @@ class EpoProvider(PatentProvider):
             print(f"[OPS auth] body={r.text[:300]}", file=sys.stderr)
         r.raise_for_status()
         j = r.json()
-        self._token = j["access_token"]
-        self._token_exp = time.time() + int(j.get("expires_in", 1200))
-        return self._token
+        return j["access_token"], time.time() + int(j.get("expires_in", 1200))
 
     # low-level search ---------------------------------------------------
     def _search(self, query: str) -> requests.Response:
         self._pace()
         token = self._get_token()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "X-OPS-Range": "1-1",  # only need total
-        }
+        # Rebuilt only when the token changes (token and headers swap as
+        # one tuple, so concurrent callers never pair a stale token).
+        headers_token, headers = self._search_headers
+        if headers_token != token:
+            headers = {"Authorization": f"Bearer {token}", **_SEARCH_HEADERS}
+            self._search_headers = (token, headers)
         r = self._session.get(
             OPS_SEARCH_URL,
             params={"q": query},
@@ -145,7 +254,17 @@ class EpoProvider(PatentProvider):
             print(f"[OPS search] body={r.text[:400]}", file=sys.stderr)
         return r
 
-    def _count_for_query(self, query: str) -> int:
+    def _count_for_query(self, query: str) -> Optional[int]:
+        total = self._cached_count(query)
+        if total is None:
+            total = self._fetch_count(query)
+            # None (fault/unknown body) is not remembered, so a transient
+            # error page doesn't stick for the provider's life
+            if total is not None:
+                self._remember_count(query, total)
+        return total
+
+    def _fetch_count(self, query: str) -> Optional[int]:
         r = self._search(query)
         if r.status_code == 404:
             return 0
@@ -167,20 +286,23 @@ class EpoProvider(PatentProvider):
             if total is not None:
                 return total
             # some OPS endpoints return XML even with Accept: JSON
-        # try XML fallback always
-        total = _extract_total_from_xml(r.text)
-        if total is not None:
-            return total
-        # If OPS responded with a fault XML, treat as zero
-        if "<fault" in r.text.lower():
-            return 0
-        # Unknown shape: return 0 but keep debug
+        # XML fallback, only for a body that is XML: a JSON body without a
+        # total is neither re-parsed nor lowercased whole
+        text = r.text or ""
+        if _looks_like_xml(text):
+            total = _extract_total_from_xml(text)
+            if total is not None:
+                return total
+            # Fault XML: no total (the caller counts it as 0, uncached)
+            if "<fault" in text.lower():
+                return None
+        # Unknown shape: no total (counted as 0, uncached) but keep debug
         if self._debug:
             print(
                 "[OPS search] unknown response shape; treating as 0",
                 file=sys.stderr,
             )
-        return 0
+        return None
 
     # PatentProvider methods --------------------------------------------
     def count_by_cpc_year(
@@ -193,8 +315,7 @@ class EpoProvider(PatentProvider):
     ) -> CountResult:
         # which/utility_only don't map cleanly in OPS search; ignored here.
         query = _q_year_cpc(year=year, cpc_prefix=(cpc or "").upper())
-        total = self._count_for_query(query)
-        return CountResult(total=total)
+        return _count_result(self._count_for_query(query))
 
     def count_by_cpc_company_year(
         self,
@@ -208,8 +329,7 @@ class EpoProvider(PatentProvider):
         query = _q_company_year_cpc(
             company=company, year=year, cpc_prefix=(cpc or "").upper()
         )
-        total = self._count_for_query(query)
-        return CountResult(total=total)
+        return _count_result(self._count_for_query(query))
 
     def assignee_discover(
         self, *, prefix: str, limit: int = 400
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Dict
 
 from ..core.contracts import Provider
 from ..core.interfaces import PatentProvider
 from .epo import EpoProvider
 from .uspto import UsptoProvider
 
+_REGISTRY: Dict[Provider, Callable[..., PatentProvider]] = {
+    Provider.USPTO: UsptoProvider,
+    Provider.EPO: EpoProvider,
+}
+
 
 def make_provider(provider: Provider, **kwargs: Any) -> PatentProvider:
-    if provider == Provider.USPTO:
-        return UsptoProvider(**kwargs)
-    if provider == Provider.EPO:
-        return EpoProvider(**kwargs)
-    raise ValueError(f"Unknown provider: {provider}")
+    # Accept plain strings ("uspto") as well as enum members
+    try:
+        factory = _REGISTRY[Provider(provider)]
+    except (ValueError, KeyError):
+        raise ValueError(f"Unknown provider: {provider}") from None
+    return factory(**kwargs)
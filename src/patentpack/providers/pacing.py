@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe request pacer shared by the providers.
+
+    Refills at rpm/60 tokens per second and holds up to `capacity` tokens,
+    so after an idle spell up to `capacity` requests go out back to back.
+    The worst case over any one minute is therefore rpm + capacity
+    requests; callers size `capacity` against their API's quota.
+    """
+
+    def __init__(self, rpm: int, capacity: int = 1) -> None:
+        self._lock = threading.Lock()
+        self.set_rpm(rpm, capacity)
+
+    def set_rpm(self, rpm: int, capacity: int = 1) -> None:
+        rpm = max(1, int(rpm))
+        with self._lock:
+            self._refill_rate = rpm / 60.0
+            self._capacity = float(max(1, int(capacity)))
+            self._tokens = self._capacity
+            self._last_refill = time.monotonic()
+
+    def acquire(self) -> None:
+        # Serialized so concurrent callers draw tokens one at a time; the
+        # request itself runs outside the lock.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate,
+            )
+            self._last_refill = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            # wait for the rest of one token, then spend it
+            time.sleep((1.0 - self._tokens) / self._refill_rate)
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
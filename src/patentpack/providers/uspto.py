@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import sys
-import time
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import requests
@@ -16,10 +18,53 @@ from ..config import (
     PATENTSEARCHKEY,
     RETRY_ALLOWED_METHODS,
     RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_JITTER,
     RETRY_STATUS_FORCELIST,
 )
 from ..core.contracts import Assignee, AssigneeList, CountResult
 from ..core.interfaces import PatentProvider, Which
+from .pacing import TokenBucket
+
+# Per-instance LRU of count totals by query: a count for fixed filters is
+# stable within a run, and panels ask for the same ones repeatedly.
+_COUNT_CACHE_SIZE = 4096
+
+# PatentSearch allows 45 requests per minute per API key
+_PATENTSEARCH_QUOTA_RPM = 45
+
+# CPC field filtered by `which`; anything but "cpc_at_issue" (incl. None)
+# means the current classification
+_CPC_FIELD_MAP: Dict[str, str] = {
+    "cpc_current": "cpc_current.cpc_subclass",
+    "cpc_at_issue": "cpc_at_issue.cpc_subclass",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_session(api_key: str) -> requests.Session:
+    # One pooled session per key, shared by every provider instance: a
+    # provider built per query/thread reuses warm keep-alive connections
+    # instead of paying a fresh TCP+TLS handshake.
+    session = requests.Session()
+    session.headers.update(
+        {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "X-Api-Key": api_key,
+        }
+    )
+    retry = Retry(
+        total=6,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class UsptoProvider(PatentProvider):
@@ -42,61 +87,87 @@ class UsptoProvider(PatentProvider):
         api_key: Optional[str] = None,
         debug: bool = False,
     ) -> None:
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
         key = api_key or PATENTSEARCHKEY
         if not key:
             raise RuntimeError(
                 "PATENTPACK_PV_KEY is required (X-Api-Key for PatentSearch). "
                 "Set env var PATENTPACK_PV_KEY or pass api_key=..."
             )
-        self._session.headers["X-Api-Key"] = key
-
-        retry = Retry(
-            total=6,
-            backoff_factor=RETRY_BACKOFF_FACTOR,
-            status_forcelist=RETRY_STATUS_FORCELIST,
-            allowed_methods=RETRY_ALLOWED_METHODS,
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
+        self._session = _get_session(key)
 
         self._timeout = DEFAULT_TIMEOUT_S
         self._debug = bool(debug)
+        self._bucket = TokenBucket(rpm)
         self._set_rpm(rpm)
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self._counts_lock = threading.Lock()
 
     # pacing -------------------------------------------------------------
     def _set_rpm(self, rpm: int) -> None:
+        # Burst sized so a worst-case minute (rpm + capacity) stays within
+        # PatentSearch's quota; at rpm >= quota - 1 it is a plain interval.
         rpm = max(1, int(rpm))
-        self._min_interval = 60.0 / rpm
-        self._last_ts = 0.0
+        self._bucket.set_rpm(rpm, capacity=_PATENTSEARCH_QUOTA_RPM - rpm)
 
     def set_rpm(self, rpm: int) -> None:
         self._set_rpm(rpm)
 
     def _pace(self) -> None:
-        now = time.monotonic()
-        wait = self._min_interval - (now - self._last_ts)
-        if wait > 0:
-            time.sleep(wait)
-        self._last_ts = time.monotonic()
+        self._bucket.acquire()
+
+    # count memo ---------------------------------------------------------
+    def _cached_count(self, key: str) -> Optional[int]:
+        with self._counts_lock:
+            total = self._counts.get(key)
+            if total is not None:
+                self._counts.move_to_end(key)
+            return total
+
+    def _remember_count(self, key: str, total: int) -> None:
+        with self._counts_lock:
+            self._counts[key] = total
+            if len(self._counts) > _COUNT_CACHE_SIZE:
+                self._counts.popitem(last=False)  # least recently used
 
     # helpers ------------------------------------------------------------
     @staticmethod
+    @lru_cache(maxsize=256)  # a panel revisits the same few years
     def _year_bounds(year: int) -> tuple[str, str]:
         return f"{year:04d}-01-01", f"{year:04d}-12-31"
 
+    def _build_filters(
+        self,
+        year: int,
+        cpc: str,
+        which: Optional[Which],
+        utility_only: bool,
+        company: Optional[str] = None,
+    ) -> List[Dict]:
+        """Shared `_and` filters of the count queries (date, CPC, ...)."""
+        start, end = self._year_bounds(year)
+        cpc_field = _CPC_FIELD_MAP.get(
+            which, _CPC_FIELD_MAP["cpc_current"]  # type: ignore[arg-type]
+        )
+        filters: List[Dict] = [
+            {"_gte": {"patent_date": start}},
+            {"_lte": {"patent_date": end}},
+            {"_begins": {cpc_field: (cpc or "").upper()}},
+        ]
+        if company is not None:
+            filters.append({"assignees.assignee_organization": company})
+        if utility_only:
+            filters.append({"patent_type": "utility"})
+        return filters
+
     def _post(self, payload: Dict) -> Dict:
+        # Serialized once, compactly; the session already sends
+        # Content-Type: application/json, and debug reuses the body.
+        body = json.dumps(payload, separators=(",", ":"), allow_nan=False)
         self._pace()
         r = self._session.post(
-            PATENTSEARCH_API_URL, json=payload, timeout=self._timeout
+            PATENTSEARCH_API_URL,
+            data=body.encode("utf-8"),
+            timeout=self._timeout,
         )
         if self._debug:
             print(
@@ -104,13 +175,22 @@ class UsptoProvider(PatentProvider):
                 file=sys.stderr,
             )
             print(
-                f"[USPTO POST] payload={json.dumps(payload)[:400]}",
+                f"[USPTO POST] payload={body[:400]}",
                 file=sys.stderr,
             )
             print(f"[USPTO POST] body={r.text[:400]}", file=sys.stderr)
         r.raise_for_status()
         return r.json()
 
+    def _count(self, payload: Dict) -> int:
+        """total_hits of a count payload, memoized on its canonical JSON."""
+        key = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        total = self._cached_count(key)
+        if total is None:
+            total = int(self._post(payload).get("total_hits", 0))
+            self._remember_count(key, total)
+        return total
+
     # PatentProvider methods --------------------------------------------
     def count_by_cpc_year(
         self,
@@ -120,30 +200,16 @@ class UsptoProvider(PatentProvider):
         which: Optional[Which] = "cpc_current",
         utility_only: bool = False,
     ) -> CountResult:
-        start, end = self._year_bounds(year)
-        cpc_prefix = (cpc or "").upper()
-        cpc_field = (
-            "cpc_current.cpc_subclass"
-            if which != "cpc_at_issue"
-            else "cpc_at_issue.cpc_subclass"
-        )
-
-        filters: List[Dict] = [
-            {"_gte": {"patent_date": start}},
-            {"_lte": {"patent_date": end}},
-            {"_begins": {cpc_field: cpc_prefix}},
-        ]
-        if utility_only:
-            filters.append({"patent_type": "utility"})
+        filters = self._build_filters(year, cpc, which, utility_only)
 
         payload = {
             "q": {"_and": filters},
-            # We only need the count; a size of 1 is enough.
+            # We only need the count; a size of 1 is enough, and one small
+            # field keeps the lone record (and its decode) tiny.
+            "f": ["patent_id"],
             "o": {"size": 1},
         }
-        data = self._post(payload)
-        total = int(data.get("total_hits", 0))
-        return CountResult(total=total)
+        return CountResult(total=self._count(payload))
 
     def count_by_cpc_company_year(
         self,
@@ -154,30 +220,16 @@ class UsptoProvider(PatentProvider):
         which: Optional[Which] = "cpc_current",
         utility_only: bool = False,
     ) -> CountResult:
-        start, end = self._year_bounds(year)
-        cpc_prefix = (cpc or "").upper()
-        cpc_field = (
-            "cpc_current.cpc_subclass"
-            if which != "cpc_at_issue"
-            else "cpc_at_issue.cpc_subclass"
+        filters = self._build_filters(
+            year, cpc, which, utility_only, company=company
         )
 
-        filters: List[Dict] = [
-            {"_gte": {"patent_date": start}},
-            {"_lte": {"patent_date": end}},
-            {"_begins": {cpc_field: cpc_prefix}},
-            {"assignees.assignee_organization": company},
-        ]
-        if utility_only:
-            filters.append({"patent_type": "utility"})
-
         payload = {
             "q": {"_and": filters},
+            "f": ["patent_id"],
             "o": {"size": 1},
         }
-        data = self._post(payload)
-        total = int(data.get("total_hits", 0))
-        return CountResult(total=total)
+        return CountResult(total=self._count(payload))
 
     def assignee_discover(
         self, *, prefix: str, limit: int = 400
@@ -203,24 +255,21 @@ class UsptoProvider(PatentProvider):
 
         # Results come back as a list of patents; we need to harvest assignees.
         patents = data.get("patents", []) or []
-        seen = set()
-        items: List[Assignee] = []
+        # org -> first Assignee seen; insertion order is the output order
+        items: Dict[str, Assignee] = {}
 
         for p in patents:
             for a in p.get("assignees", []) or []:
                 org = a.get("assignee_organization") or ""
-                if not org or org in seen:
+                if not org or org in items:
                     continue
-                seen.add(org)
-                items.append(
-                    Assignee(
-                        organization=org,
-                        country=a.get("assignee_country"),
-                        state=a.get("assignee_state"),
-                        city=a.get("assignee_city"),
-                    )
+                items[org] = Assignee(
+                    organization=org,
+                    country=a.get("assignee_country"),
+                    state=a.get("assignee_state"),
+                    city=a.get("assignee_city"),
                 )
                 if len(items) >= limit:
-                    return AssigneeList(items=items)
+                    return AssigneeList(items=list(items.values()))
 
-        return AssigneeList(items=items)
+        return AssigneeList(items=list(items.values()))
@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict
 
@@ -52,36 +53,30 @@ def gleif_session():
 # =============================================================================
 
 
+# Deterministic but varied mock counts by CPC class
+# (enough for assertions like >0, !=0, etc.)
+_USPTO_TABLE = {"Y02": 10, "B60": 9, "H01": 6, "G06": 12, "H04": 8}
+_EPO_TABLE = {"Y02": 772, "B60": 1315, "H01": 423, "G06": 1200, "H04": 850}
+# 'cpc=/low B60' (the OPS CQL built by EpoProvider) -> 'B60'
+_CPC_RE = re.compile(r"cpc\s*=\s*/low\s+([A-Z0-9]{3})", re.I)
+
+
 def _mock_uspto_post(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Emulate PatentsView /api/v1/patent/ count responses.
     Returns {"total_hits": <int>} deterministically from the CPC prefix.
     """
-    # Extract a CPC prefix from the payload (handles both year and company queries)
+    # The CPC filter is the one {"_begins": {<cpc field>: <prefix>}} entry
+    # (year and company queries alike)
     cpc_prefix = "Y02"
-    try:
-        filters = payload.get("q", {}).get("_and", [])
-        for f in filters:
-            if "_begins" in f:
-                begins = f["_begins"]
-                # cpc_current.cpc_subclass or cpc_at_issue.cpc_subclass -> value like "B60"
-                cpc_prefix = next(iter(begins.values()))
-                break
-    except Exception:
-        pass
-
-    cpc_prefix = (cpc_prefix or "").upper()
-
-    # Deterministic but varied mock counts by CPC class
-    # (enough for assertions like >0, !=0, etc.)
-    table = {
-        "Y02": 10,
-        "B60": 9,
-        "H01": 6,
-        "G06": 12,
-        "H04": 8,
-    }
-    total = table.get(cpc_prefix[:3], 3)
+    for f in payload.get("q", {}).get("_and", ()):
+        begins = f.get("_begins")
+        if begins:
+            # cpc_current.cpc_subclass or cpc_at_issue.cpc_subclass
+            (cpc_prefix,) = begins.values()
+            break
+
+    total = _USPTO_TABLE.get((cpc_prefix or "")[:3].upper(), 3)
     return {"error": False, "count": 0, "total_hits": total, "patents": []}
 
 
@@ -90,25 +85,8 @@ def _mock_epo_count_for_query(query: str) -> int:
     Emulate EPO OPS count_for_query() by inspecting the CQL.
     Looks for 'cpc=/low <CLASS>' and returns a deterministic count.
     """
-    # crude parse: find 'cpc =/low ' then take next token
-    q = query.upper()
-    needle = "CPC =/LOW "
-    cls = "Y02"
-    try:
-        if needle in q:
-            start = q.index(needle) + len(needle)
-            cls = q[start : start + 3]
-    except Exception:
-        pass
-
-    table = {
-        "Y02": 772,
-        "B60": 1315,
-        "H01": 423,
-        "G06": 1200,
-        "H04": 850,
-    }
-    return table.get(cls, 5)
+    m = _CPC_RE.search(query)
+    return _EPO_TABLE.get(m.group(1).upper() if m else "Y02", 5)
 
 
 # =============================================================================
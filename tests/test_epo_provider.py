@@ -1,7 +1,8 @@
 import pytest
 
+import patentpack.providers.epo as epo_mod
 from patentpack.core.contracts import CountResult
-from patentpack.providers.epo import EpoProvider
+from patentpack.providers.epo import EpoProvider, _extract_total_from_xml
 
 
 def test_epo_count_cpc_year_mock(monkeypatch):
@@ -47,3 +48,87 @@ def test_epo_count_cpc_company_year_mock(monkeypatch):
     assert 'applicant="Volkswagen AG"' in q
     assert "cpc=/low Y02" in q
     assert 'pd within "20190101 20191231"' in q
+
+
+def test_extract_total_from_xml():
+    refs = "<ops:publication-reference/>" * 200  # well past one feed slice
+    xml = (
+        '<ops:world-patent-data xmlns:ops="http://ops.epo.org">'
+        '<ops:biblio-search total-result-count="772">'
+        f"<ops:search-result>{refs}</ops:search-result>"
+        "</ops:biblio-search></ops:world-patent-data>"
+    )
+    assert _extract_total_from_xml(xml) == 772
+    # no attribute: the pull-parser fallback finds the element, no total
+    assert (
+        _extract_total_from_xml(xml.replace("total-result-count", "x")) is None
+    )
+    assert _extract_total_from_xml("") is None
+    assert _extract_total_from_xml("<fault>quota</fault>") is None
+
+
+def test_epo_token_shared_across_instances(monkeypatch):
+    monkeypatch.setattr(epo_mod, "_TOKEN_CACHE", {})
+    posts = []
+
+    class _Resp:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"access_token": f"T{len(posts)}", "expires_in": "1200"}
+
+    def fake_post(session, url, **kwargs):
+        posts.append(url)
+        return _Resp()
+
+    # auth goes through the provider's session, not module-level requests
+    monkeypatch.setattr(epo_mod.requests.Session, "post", fake_post)
+
+    a = EpoProvider(key="K", secret="S", rpm=999)
+    b = EpoProvider(key="K", secret="S", rpm=999)
+    assert a._get_token() == b._get_token() == "T1"
+    assert len(posts) == 1
+
+    # different credentials get their own token
+    c = EpoProvider(key="K2", secret="S", rpm=999)
+    assert c._get_token() == "T2"
+
+
+def test_epo_counts_are_memoized(monkeypatch):
+    queries = []
+
+    class _Resp:
+        def __init__(self, status_code, text=""):
+            self.status_code = status_code
+            self.text = text
+            self.headers = {"Content-Type": "application/xml"}
+
+    def fake_search(self, query: str):
+        queries.append(query)
+        if "Y02" in query:
+            return _Resp(404)  # no hits: a real zero, remembered
+        return _Resp(200, "<fault>quota exceeded</fault>")
+
+    monkeypatch.setattr(EpoProvider, "_search", fake_search)
+
+    p = EpoProvider(key="DUMMY", secret="DUMMY", rpm=999, debug=False)
+    for _ in range(3):
+        assert p.count_by_cpc_year(year=2021, cpc="Y02").total == 0
+    assert len(queries) == 1
+
+    # fault bodies count as 0 but are retried on the next call
+    for _ in range(2):
+        assert p.count_by_cpc_year(year=2021, cpc="H01").total == 0
+    assert len(queries) == 3
+
+
+def test_epo_fault_count_is_flagged(monkeypatch):
+    monkeypatch.setattr(EpoProvider, "_fetch_count", lambda self, q: None)
+
+    p = EpoProvider(key="DUMMY", secret="DUMMY", rpm=999, debug=False)
+    res = p.count_by_cpc_company_year(year=2021, cpc="Y02", company="Foo")
+    assert res.total == 0
+    assert res.meta == {"fallback": True}
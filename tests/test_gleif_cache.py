@@ -0,0 +1,55 @@
+import types
+
+from patentpack.gleif import search as search_mod
+from patentpack.gleif.cache import ResponseCache
+
+
+def test_response_cache_roundtrip_and_key_order(tmp_path):
+    cache = ResponseCache(path=tmp_path / "gleif.sqlite")
+    params = {"filter[entity.legalName]": "Foo Inc", "page[size]": "5"}
+    assert cache.get(params) is None
+
+    cache.put(params, {"data": [{"id": "L1"}]})
+    # Param order must not matter
+    flipped = {"page[size]": "5", "filter[entity.legalName]": "Foo Inc"}
+    assert cache.get(flipped) == {"data": [{"id": "L1"}]}
+
+    # Persisted across instances
+    cache.close()
+    again = ResponseCache(path=tmp_path / "gleif.sqlite")
+    assert again.get(params) == {"data": [{"id": "L1"}]}
+
+
+def test_response_cache_expiry(tmp_path):
+    cache = ResponseCache(path=tmp_path / "gleif.sqlite", ttl_s=-1)
+    cache.put({"x": "y"}, {"data": []})
+    assert cache.get({"x": "y"}) is None
+
+
+def test_search_union_uses_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        search_mod, "expand_query_variants", lambda name: ["Foo Inc"]
+    )
+    monkeypatch.setattr(search_mod, "country_hints_from_name", lambda n: [])
+
+    calls = []
+
+    def fake_safe_get(session, params):
+        calls.append(params)
+        if "filter[fulltext]" in params:
+            return None, 503, "down"  # failures are not cached
+        return {"data": [{"id": "L1"}]}, 200, "ok"
+
+    monkeypatch.setattr(search_mod, "safe_get", fake_safe_get)
+    cache = ResponseCache(path=tmp_path / "gleif.sqlite")
+    sess = types.SimpleNamespace()
+
+    rows = search_mod.gleif_search_union(sess, "Foo Inc", cache=cache)
+    assert [r["id"] for r in rows] == ["L1"]
+    assert len(calls) == 2
+
+    rows = search_mod.gleif_search_union(sess, "Foo Inc", cache=cache)
+    assert [r["id"] for r in rows] == ["L1"]
+    # legalName served from cache; the failed fulltext query is retried
+    assert len(calls) == 3
+    assert "filter[fulltext]" in calls[-1]
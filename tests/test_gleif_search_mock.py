@@ -67,3 +67,50 @@ def test_gleif_search_union_mock(monkeypatch):
     keys_seen = {tuple(sorted(k for k in p.keys())) for p in calls}
     assert any("filter[entity.legalName]" in ks for ks in keys_seen)
     assert any("filter[fulltext]" in ks for ks in keys_seen)
+
+
+def test_gleif_search_union_parallel_keeps_query_order(monkeypatch):
+    import time
+
+    monkeypatch.setattr(
+        search_mod, "expand_query_variants", lambda name: ["A", "B", "C"]
+    )
+    monkeypatch.setattr(search_mod, "country_hints_from_name", lambda n: [])
+
+    def fake_safe_get(session, params):
+        v = (
+            params.get("filter[entity.legalName]")
+            or params["filter[fulltext]"]
+        )
+        # Earlier queries finish last
+        time.sleep({"A": 0.03, "B": 0.02, "C": 0.0}[v])
+        return {"data": [{"id": f"L{v}"}]}, 200, "ok"
+
+    monkeypatch.setattr(search_mod, "safe_get", fake_safe_get)
+
+    rows = search_mod.gleif_search_union(
+        types.SimpleNamespace(), "x", max_workers=4
+    )
+    assert [r["id"] for r in rows] == ["LA", "LB", "LC"]
+
+
+def test_gleif_search_union_skips_duplicate_queries(monkeypatch):
+    monkeypatch.setattr(
+        search_mod, "expand_query_variants", lambda name: ["Foo", "Foo"]
+    )
+    monkeypatch.setattr(
+        search_mod, "country_hints_from_name", lambda n: ["DE", "DE"]
+    )
+
+    calls = []
+
+    def fake_safe_get(session, params):
+        calls.append(tuple(sorted(params.items())))
+        return {"data": []}, 200, "ok"
+
+    monkeypatch.setattr(search_mod, "safe_get", fake_safe_get)
+    search_mod.gleif_search_union(types.SimpleNamespace(), "Foo")
+
+    # one legalName, one legalName+country, one fulltext
+    assert len(calls) == 3
+    assert len(set(calls)) == 3
@@ -1,4 +1,6 @@
 import json
+import multiprocessing
+import sys
 import tempfile
 from pathlib import Path
 
@@ -8,6 +10,14 @@ from patentpack.idmap.cache import CacheKey, NamePlanCache
 from patentpack.idmap.variants import build_cache_aware_variants
 
 
+def _put_many(path: str, tag: str, n: int) -> None:
+    """Worker for the cross-process test: load (maybe compact), then put."""
+    cache = NamePlanCache(path=Path(path))
+    for i in range(n):
+        key = CacheKey(provider="uspto", year=2020, op="eq", key=f"{tag}{i}")
+        cache.put(key, {"has_hits": True})
+
+
 def test_cache_location():
     """Test that cache is now stored in data/cache/ instead of data/"""
     print("Testing cache location...")
@@ -394,6 +404,17 @@ class TestNamePlanCache:
 
         assert sample_cache.has_hits(key) is False
 
+    def test_cache_get_has_hits(self, sample_cache: NamePlanCache):
+        """Test get_has_hits distinguishes missing entries from misses."""
+        key = CacheKey(provider="uspto", year=2020, op="eq", key="test")
+        assert sample_cache.get_has_hits(key) is None
+
+        sample_cache.put(key, {"n": 3})
+        assert sample_cache.get_has_hits(key) is False
+
+        sample_cache.mark_has_hits(key, True)
+        assert sample_cache.get_has_hits(key) is True
+
     def test_cache_mark_has_hits(self, sample_cache: NamePlanCache):
         """Test mark_has_hits method."""
         key = CacheKey(provider="uspto", year=2020, op="discover", key="test")
@@ -488,6 +509,91 @@ class TestNamePlanCache:
             expected_hits = i % 2 == 0
             assert sample_cache.has_hits(key) == expected_hits
 
+    def test_cache_load_compacts_superseded_lines(self, temp_cache_dir: Path):
+        """Loading a file dominated by stale updates rewrites it compactly."""
+        cache_path = temp_cache_dir / "stale.jsonl"
+        with cache_path.open("w") as f:
+            for i in range(1200):
+                rec = {
+                    "provider": "uspto",
+                    "year": 2020,
+                    "op": "eq",
+                    "key": f"k{i % 3}",
+                    "val": {"has_hits": i % 2 == 0, "n": i},
+                }
+                f.write(json.dumps(rec) + "\n")
+
+        cache = NamePlanCache(path=cache_path)
+        key = CacheKey(provider="uspto", year=2020, op="eq", key="k2")
+        assert cache.get(key) == {"has_hits": False, "n": 1199}
+
+        lines = cache_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+
+        # Latest values survive a reload of the compacted file
+        again = NamePlanCache(path=cache_path)
+        assert again.get(key) == {"has_hits": False, "n": 1199}
+        assert len(again._mem) == 3
+
+    def test_cache_compact_skipped_if_file_changed(self, temp_cache_dir: Path):
+        """A record appended after the read survives a pending compaction."""
+        cache_path = temp_cache_dir / "shared.jsonl"
+        cache = NamePlanCache(path=cache_path)
+        key = CacheKey(provider="uspto", year=2020, op="eq", key="mine")
+        cache.put(key, {"has_hits": True})
+        seen = cache_path.stat()
+
+        # another process appends between this one's read and replace
+        other = CacheKey(provider="uspto", year=2020, op="eq", key="theirs")
+        with cache_path.open("a", encoding="utf-8") as f:
+            f.write(
+                NamePlanCache._record(
+                    (other.provider, other.year, other.op, other.key),
+                    {"has_hits": False},
+                )
+            )
+
+        cache._compact(seen)
+
+        assert NamePlanCache(path=cache_path).get(other) == {"has_hits": False}
+        assert list(temp_cache_dir.glob("*.tmp")) == []
+
+    @pytest.mark.skipif(
+        sys.platform == "win32", reason="fcntl file lock is POSIX-only"
+    )
+    def test_cache_compaction_keeps_other_process_appends(
+        self, temp_cache_dir: Path
+    ):
+        """Processes compacting and appending at once lose no records."""
+        cache_path = temp_cache_dir / "shared.jsonl"
+        with cache_path.open("w") as f:
+            for i in range(1500):  # stale enough to compact on every load
+                rec = {
+                    "provider": "uspto",
+                    "year": 2020,
+                    "op": "eq",
+                    "key": f"old{i % 5}",
+                    "val": {"has_hits": True},
+                }
+                f.write(json.dumps(rec) + "\n")
+
+        ctx = multiprocessing.get_context("fork")
+        procs = [
+            ctx.Process(
+                target=_put_many, args=(str(cache_path), f"p{j}_", 200)
+            )
+            for j in range(4)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+            assert p.exitcode == 0
+
+        mem = NamePlanCache(path=cache_path)
+        mem.get(CacheKey(provider="uspto", year=2020, op="eq", key="old0"))
+        assert len(mem._mem) == 5 + 4 * 200
+
 
 def main():
     """Run all tests"""
@@ -319,6 +319,81 @@ class TestNameResolver:
         assert len(events1) > 0
         assert len(events2) > 0
 
+    def test_name_resolver_concurrent_eq_keeps_order(
+        self, mock_provider, temp_cache_dir
+    ):
+        """Concurrent eq lookups yield the same stream as sequential ones."""
+        harvested = [f"Apple {i}" for i in range(12)] + ["Apple 3"]
+        provider = type(mock_provider)(
+            eq_map={(n, 2020): i + 1 for i, n in enumerate(harvested)},
+            disc_map={("Apple", 2020): harvested},
+        )
+        candidates = [("Apple", "orig"), ("Apple Inc", "gleif_legal")]
+
+        def run(n: int, path: str):
+            resolver = NameResolver(
+                provider, NamePlanCache(path=temp_cache_dir / path)
+            )
+            return [
+                (type(e).__name__, getattr(e, "variant", ""), e.bucket)
+                + ((e.total,) if isinstance(e, EqAttemptResult) else ())
+                for e in resolver.resolve(
+                    base_query="Apple",
+                    year=2020,
+                    candidates=candidates,
+                    max_concurrency=n,
+                )
+            ]
+
+        assert run(8, "par.jsonl") == run(1, "seq.jsonl")
+
+    def test_name_resolver_early_stop_submits_no_more(
+        self, sample_cache: NamePlanCache
+    ):
+        """Concurrent eq runs at most max_concurrency ahead of the consumer."""
+        calls = []
+
+        class _Provider:
+            def count_eq(self, company, *, year):
+                calls.append(company)
+                return 1
+
+        names = [f"Apple {i}" for i in range(20)]
+        with NameResolver(_Provider(), sample_cache) as resolver:
+            cfg = ResolveConfig(max_concurrency=2)
+            totals = resolver._eq_totals(2020, names, cfg)
+            assert next(totals) == 1
+            totals.close()
+            pool = resolver._pool
+        assert resolver._pool is None
+        pool.shutdown(wait=True)  # let any running call finish
+        assert len(calls) <= 3
+
+    def test_name_resolver_stop_on_first_hit(
+        self, mock_provider, sample_cache: NamePlanCache
+    ):
+        """A seed eq hit skips discovery only when stop_on_first_hit is set."""
+        provider = type(mock_provider)(
+            eq_map={("Apple Inc", 2020): 5},
+            disc_map={("Apple", 2020): ["Apple Inc", "Apple Corp"]},
+        )
+        resolver = NameResolver(provider, sample_cache)
+        candidates = [("Apple", "orig"), ("Apple Inc", "gleif_legal")]
+
+        def kinds(stop: bool):
+            return [
+                type(e).__name__
+                for e in resolver.resolve(
+                    base_query="Apple",
+                    year=2020,
+                    candidates=candidates,
+                    stop_on_first_hit=stop,
+                )
+            ]
+
+        assert kinds(True) == ["EqAttemptResult", "EqAttemptResult"]
+        assert "DiscoveryResult" in kinds(False)
+
 
 class TestEventTypes:
     """Test the event type dataclasses."""
@@ -1,5 +1,6 @@
 import pytest
 
+import patentpack.idmap.variants as variants_mod
 from patentpack.idmap.cache import CacheKey, NamePlanCache
 from patentpack.idmap.types import Bucket, VariantItem
 from patentpack.idmap.variants import (
@@ -7,6 +8,7 @@ from patentpack.idmap.variants import (
     _has_designator,
     _squash_ws,
     build_bucketed_variants,
+    build_bucketed_variants_soa,
     build_cache_aware_variants,
 )
 
@@ -139,6 +141,34 @@ class TestBuildBucketedVariants:
 
         assert len(variants) <= 5
 
+    def test_variants_max_limit_skips_tail_expansions(self, monkeypatch):
+        """Test that seeds past the cap are never expanded."""
+        calls: list[str] = []
+
+        def fake_expand(seed):
+            calls.append(seed)
+            return [f"{seed} Holdings Inc", f"{seed} Group Ltd"]
+
+        monkeypatch.setattr(variants_mod, "expand_query_variants", fake_expand)
+        variants_mod._designated_expansions.cache_clear()
+        variants_mod._bucketed_variants.cache_clear()
+        try:
+            variants = build_bucketed_variants(
+                base_name="Acme Capped",
+                gleif_legal="Acme Capped Legal",
+                subsidiaries=["Capped Sub One", "Capped Sub Two"],
+                include_expansions=True,
+                max_variants=14,
+            )
+        finally:
+            variants_mod._designated_expansions.cache_clear()
+            variants_mod._bucketed_variants.cache_clear()
+
+        assert len(variants) == 14
+        assert variants[-1]["bucket"] == "expand_orig"
+        # the subsidiaries' expansions would only land past the cap
+        assert calls == ["Acme Capped Legal", "Acme Capped"]
+
     def test_variants_empty_inputs(self):
         """Test variant generation with empty inputs."""
         variants = build_bucketed_variants(
@@ -253,6 +283,32 @@ class TestBuildCacheAwareVariants:
         assert variants[0]["name"] == "Apple Inc"
         assert variants[0]["bucket"] == "orig"
 
+    def test_cache_aware_squashes_whitespace(
+        self, sample_cache: NamePlanCache
+    ):
+        """Test that padded base names find the squashed cache key."""
+        orig_key = CacheKey(
+            provider="uspto", year=2020, op="discover", key="Apple Inc"
+        )
+        sample_cache.mark_has_hits(orig_key, True)
+
+        variants = build_cache_aware_variants(
+            base_name="  Apple   Inc ",
+            cache=sample_cache,
+            provider_name="uspto",
+            year=2020,
+        )
+        assert len(variants) == 1
+
+        # Case is significant for the provider, so it stays in the key
+        variants = build_cache_aware_variants(
+            base_name="APPLE INC",
+            cache=sample_cache,
+            provider_name="uspto",
+            year=2020,
+        )
+        assert len(variants) > 1
+
     def test_cache_aware_different_provider(self, sample_cache: NamePlanCache):
         """Test that cache keys are provider-specific."""
         # Mark hit for one provider
@@ -366,6 +422,26 @@ class TestVariantItemStructure:
         names = [v["name"] for v in variants]
         assert len(names) == len(set(names)), "Variants should be unique"
 
+    def test_soa_matches_list_of_items(self):
+        """Test that the parallel-list form carries the same plan."""
+        kwargs = dict(
+            base_name="Apple Inc",
+            gleif_legal="Apple Inc.",
+            gleif_other_names=["Apple Computer Inc"],
+            subsidiaries=["Beats Electronics"],
+            include_expansions=True,
+            max_variants=7,
+        )
+        variants = build_bucketed_variants(**kwargs)
+        names, buckets, kinds = build_bucketed_variants_soa(**kwargs)
+
+        assert names == [v["name"] for v in variants]
+        assert buckets == [v["bucket"] for v in variants]
+        assert kinds == [v["kind"] for v in variants]
+
+        # Empty plans still unpack into three lists
+        assert build_bucketed_variants_soa(base_name="") == ([], [], [])
+
     def test_variant_bucket_distribution(self):
         """Test that variants are distributed across expected buckets."""
         variants = build_bucketed_variants(
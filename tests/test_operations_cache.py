@@ -0,0 +1,100 @@
+from patentpack.core.contracts import CountResult
+from patentpack.operations import cpc_class_vector
+from patentpack.operations.cache import VectorCache, vector_key
+
+
+class _CountingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def count_by_cpc_company_year(self, *, year, cpc, company, **kw):
+        self.calls.append(cpc)
+        return CountResult(total={"A01": 3, "B02": 0}.get(cpc, 1))
+
+
+def test_vector_cache_roundtrip_and_expiry(tmp_path):
+    key = vector_key(
+        provider="P",
+        level="class",
+        prefixes=["A01", "B02"],
+        company="Foo Inc",
+        year=2020,
+    )
+    cache = VectorCache(path=tmp_path / "vec.sqlite")
+    assert cache.get(key) is None
+
+    cache.put(key, {"A01": 3, "B02": 0})
+    cache.close()
+    again = VectorCache(path=tmp_path / "vec.sqlite")
+    assert again.get(key) == {"A01": 3, "B02": 0}
+
+    # Prefix order and query options are part of the key
+    assert key != vector_key(
+        provider="P",
+        level="class",
+        prefixes=["B02", "A01"],
+        company="Foo Inc",
+        year=2020,
+    )
+    assert key != vector_key(
+        provider="P",
+        level="class",
+        prefixes=["A01", "B02"],
+        company="Foo Inc",
+        year=2020,
+        utility_only=True,
+    )
+
+    stale = VectorCache(path=tmp_path / "vec.sqlite", ttl_s=-1)
+    assert stale.get(key) is None
+
+
+def test_cpc_class_vector_uses_cache(tmp_path):
+    cache = VectorCache(path=tmp_path / "vec.sqlite")
+    provider = _CountingProvider()
+    kwargs = dict(
+        company="Foo Inc",
+        year=2020,
+        codes=["A01B1/00", "A01C", "B02"],
+        max_workers=1,
+        cache=cache,
+    )
+
+    first = cpc_class_vector(provider, **kwargs)
+    assert dict(first.bins) == {"A01": 3, "B02": 0}
+    assert first.meta["cache"] == "miss"
+    assert provider.calls == ["A01", "B02"]
+
+    second = cpc_class_vector(provider, keep_zeros=False, **kwargs)
+    assert dict(second.bins) == {"A01": 3}
+    assert second.meta["cache"] == "hit"
+    assert provider.calls == ["A01", "B02"]  # no new provider calls
+
+
+def test_cpc_class_vector_skips_cache_on_fallback(tmp_path):
+    class _FlakyProvider(_CountingProvider):
+        def count_by_cpc_company_year(self, *, year, cpc, company, **kw):
+            self.calls.append(cpc)
+            if cpc == "B02":  # e.g. an OPS fault body
+                return CountResult(total=0, meta={"fallback": True})
+            return CountResult(total=3)
+
+    cache = VectorCache(path=tmp_path / "vec.sqlite")
+    provider = _FlakyProvider()
+    kwargs = dict(
+        company="Foo Inc",
+        year=2020,
+        codes=["A01", "B02"],
+        max_workers=1,
+        cache=cache,
+    )
+
+    first = cpc_class_vector(provider, **kwargs)
+    assert dict(first.bins) == {"A01": 3, "B02": 0}
+    assert first.meta["cache"] == "skip"
+    assert first.meta["fallback_counts"] == 1
+
+    # nothing was stored: the next run asks the provider again
+    second = cpc_class_vector(provider, **kwargs)
+    assert second.meta["cache"] == "skip"
+    assert provider.calls == ["A01", "B02", "A01", "B02"]
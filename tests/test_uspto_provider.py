@@ -53,3 +53,57 @@ def test_uspto_count_cpc_company_year_mock(monkeypatch):
     assert {"assignees.assignee_organization": "Ford Motor Company"} in q
     # cpc prefix normalized
     assert any(f.get("_begins", {}).get("cpc_current.cpc_subclass") == "B60" for f in q)
+
+
+def test_uspto_count_requests_minimal_fields(monkeypatch):
+    payloads = []
+
+    def fake_post(self, payload):
+        payloads.append(payload)
+        return {"error": False, "count": 1, "total_hits": 3, "patents": []}
+
+    monkeypatch.setattr(UsptoProvider, "_post", fake_post)
+
+    p = UsptoProvider(api_key="DUMMY", rpm=999, debug=False)
+    p.count_by_cpc_year(year=2019, cpc="Y02")
+    p.count_by_cpc_company_year(year=2019, cpc="Y02", company="Foo Inc")
+
+    # counts only read total_hits: the one returned record stays tiny
+    assert [pl["f"] for pl in payloads] == [["patent_id"], ["patent_id"]]
+
+
+def test_uspto_counts_are_memoized(monkeypatch):
+    payloads = []
+
+    def fake_post(self, payload):
+        payloads.append(payload)
+        return {"error": False, "count": 1, "total_hits": 5, "patents": []}
+
+    monkeypatch.setattr(UsptoProvider, "_post", fake_post)
+
+    p = UsptoProvider(api_key="DUMMY", rpm=999, debug=False)
+    for _ in range(3):
+        assert p.count_by_cpc_year(year=2019, cpc="Y02").total == 5
+    assert len(payloads) == 1
+
+    # different filters are a different count
+    p.count_by_cpc_year(year=2019, cpc="Y02", utility_only=True)
+    assert len(payloads) == 2
+
+
+def test_uspto_session_shared_per_key():
+    a = UsptoProvider(api_key="DUMMY", rpm=999)
+    b = UsptoProvider(api_key="DUMMY", rpm=999)
+    c = UsptoProvider(api_key="OTHER", rpm=999)
+
+    assert a._session is b._session
+    assert c._session is not a._session
+    assert c._session.headers["X-Api-Key"] == "OTHER"
+
+
+@pytest.mark.parametrize("rpm", [1, 40, 44])
+def test_uspto_burst_stays_within_quota(rpm):
+    p = UsptoProvider(api_key="DUMMY", rpm=rpm)
+    # worst-case minute: a full bucket plus one minute of refill
+    assert rpm + p._bucket._capacity <= 45
+    assert p._bucket._capacity >= 1